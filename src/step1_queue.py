@@ -1,5 +1,8 @@
-import os, re, yaml, requests, logging, unicodedata
+import io, os, re, yaml, requests, logging, unicodedata
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from dotenv import load_dotenv
 from utils import gmail_mgr
@@ -9,6 +12,74 @@ from utils import logging_setup
 # Set up logger for this module
 logger = logging_setup.get_logger(__name__)
 
+# Shared HTTP session, so job page fetches reuse pooled keep-alive connections
+# instead of paying a new TCP/TLS handshake per job
+FETCH_WORKERS = 8
+# Job page fetches submitted ahead of the parse/save loop, which bounds the page bodies held in memory
+FETCH_WINDOW = 2 * FETCH_WORKERS
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Sidecar file under src/jobs/ recording every job ID already saved
+ID_INDEX_FILENAME = '.id_index.txt'
+
+# Write buffer for saved job files, so a large page or description goes out in a few
+# write syscalls instead of many 8KB ones
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Set once load() has read the .env file
+_ENV_LOADED = False
+
+# Prefer the LibYAML-backed dumper when PyYAML was built with it. LibYAML analyzes
+# each scalar (printability, whether '|' block style is legal) in C, so the
+# LiteralStr description costs no Python-level scan when it is dumped.
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+
+# Characters replaced with ASCII equivalents by sanitize_text_for_yaml
+_REPLACEMENTS = {
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201c': '"',  # Left double quotation mark
+    '\u201d': '"',  # Right double quotation mark
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u00a0': ' ',  # Non-breaking space
+    '\u00ad': '',   # Soft hyphen
+}
+
+
+class _Sanitized(str):
+    """Marks a string that has already been through sanitize_text_for_yaml."""
+
+
+
+class _SanitizeTable(dict):
+    """
+    str.translate() table used by sanitize_text_for_yaml.  The explicit replacements are
+    preloaded; any other code point is classified the first time it is seen (dropped if it
+    is a control or other non-printable character, except newlines, tabs and carriage
+    returns) and memoized, so the table only ever holds characters that have actually
+    appeared rather than all 1.1M code points.
+    """
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isprintable() or char in '\n\t\r' else None
+        self[codepoint] = value
+        return value
+
+_TRANSLATE = _SanitizeTable(str.maketrans(_REPLACEMENTS))
+
+# Zero-width and invisible formatting characters, deleted by the same translate() pass
+_TRANSLATE.update({cp: None
+                   for lo, hi in ((0x200b, 0x200f), (0x2028, 0x202f), (0x205f, 0x206f), (0xfeff, 0xfeff))
+                   for cp in range(lo, hi + 1)})
+
 
 
 def sanitize_text_for_yaml(text):
@@ -23,38 +94,20 @@ def sanitize_text_for_yaml(text):
     """
     if not isinstance(text, str):
         return text
+    if isinstance(text, _Sanitized):
+        return text
     
-    # Step 1: Normalize Unicode characters (decompose and recompose)
-    text = unicodedata.normalize('NFKC', text)
-    
-    # Step 2: Remove or replace problematic Unicode categories
-    # Remove control characters (except newlines, tabs, carriage returns)
-    text = ''.join(char for char in text if unicodedata.category(char) not in ['Cc'] or char in ['\n', '\t', '\r'])
-    
-    # Step 3: Remove specific problematic characters that can break YAML
-    # Remove zero-width characters
-    text = re.sub(r'[\u200b-\u200f\u2028-\u202f\u205f-\u206f\ufeff]', '', text)
-    
-    # Step 4: Replace smart quotes and similar characters with ASCII equivalents
-    replacements = {
-        '\u2018': "'",  # Left single quotation mark
-        '\u2019': "'",  # Right single quotation mark
-        '\u201c': '"',  # Left double quotation mark
-        '\u201d': '"',  # Right double quotation mark
-        '\u2013': '-',  # En dash
-        '\u2014': '-',  # Em dash
-        '\u2026': '...',  # Horizontal ellipsis
-        '\u00a0': ' ',  # Non-breaking space
-        '\u00ad': '',   # Soft hyphen
-    }
-    
-    for old_char, new_char in replacements.items():
-        text = text.replace(old_char, new_char)
+    # Step 1: Normalize Unicode characters (decompose and recompose);
+    # the quick check avoids building a new string when text is already NFKC
+    if not unicodedata.is_normalized('NFKC', text):
+        text = unicodedata.normalize('NFKC', text)
     
-    # Step 5: Remove any remaining non-printable characters except common whitespace
-    text = ''.join(char for char in text if char.isprintable() or char in ['\n', '\t', '\r', ' '])
+    # Step 2: In a single pass, replace smart quotes and similar characters with ASCII
+    # equivalents, and remove zero-width, control and other non-printable characters
+    # (except newlines, tabs, carriage returns)
+    text = text.translate(_TRANSLATE)
     
-    # Step 6: Clean up excessive whitespace
+    # Step 3: Clean up excessive whitespace
     # Replace multiple consecutive spaces with single space
     text = re.sub(r' +', ' ', text)
     
@@ -87,6 +140,41 @@ def sanitize_job_data(job_data):
         return job_data
 
 
+def _sanitize_flat(job_data: dict) -> dict:
+    """
+    Sanitize the string values of a flat job dictionary in a single pass.
+    Falls back to sanitize_job_data if any value is a nested dict or list.
+    """
+    if any(isinstance(v, (dict, list)) for v in job_data.values()):
+        return sanitize_job_data(job_data)
+    return {k: (sanitize_text_for_yaml(v) if isinstance(v, str) else v) for k, v in job_data.items()}
+
+
+
+# Precompiled patterns used by _to_filename
+_RE_FN_UNSAFE = re.compile(r'[\\/:*?"<>|.]+')
+_RE_FN_NONWORD = re.compile(r'[^\w\- ]+')
+_RE_WS = re.compile(r'\s+')
+
+
+def _to_filename(s: str) -> str:
+    """
+    Convert an already YAML-sanitized company or job title into a string safe
+    for job file and folder names (see sanitize_text_for_yaml).
+    """
+    if not s:
+        return 'NA'
+    # replace path separators, dots and other unsafe chars with underscores
+    out = _RE_FN_UNSAFE.sub('_', s)
+    # also replace control chars and other non-printables (disallow dot)
+    out = _RE_FN_NONWORD.sub('_', out)
+    # collapse whitespace to single space
+    out = _RE_WS.sub(' ', out).strip()
+    out = out.replace(' _ ', ' ')
+    # limit length
+    return out[:200]
+
+
 
 # helper to force YAML literal block for specific strings
 # ------------------------------------------------------
@@ -94,17 +182,38 @@ def sanitize_job_data(job_data):
 # How it’s used: we register a YAML representer for LiteralStr that emits that value with style '|' (block literal). 
 # Wrapping job['job_description'] = LiteralStr(text) makes that one field produce a multi-line literal in the YAML output 
 # while leaving all other strings unchanged.
-class LiteralStr(str):
+# LiteralStr extends _Sanitized, since it only ever wraps already-sanitized text; this
+# lets sanitize_job_data pass it through untouched instead of re-sanitizing (and un-tagging) it.
+class LiteralStr(_Sanitized):
     pass
 
 def _literal_representer(dumper, data):
-    return dumper.represent_scalar('tag:yaml.org,2002:str', data, style='|')
+    # the LibYAML emitter only accepts exact str values, not subclasses
+    return dumper.represent_scalar('tag:yaml.org,2002:str', str(data), style='|')
 
 yaml.SafeDumper.add_representer(LiteralStr, _literal_representer)
+_Dumper.add_representer(LiteralStr, _literal_representer)
 # ------------------------------------------------------
 
 
 
+def _scandir_recursive(path):
+    """
+    Recursively yield os.DirEntry objects for every regular file under path.
+    Uses os.scandir so file-type checks come from the cached directory entry
+    instead of a fresh stat() per file; symlinks are skipped.
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+
 def get_all_ids(job_path:Path = None) -> list:
     """
     Recursively iterate thru the supplied job_path and collect a unique list of
@@ -130,19 +239,17 @@ def get_all_ids(job_path:Path = None) -> list:
     
     try:
         # Recursively find all .yaml and .html files (handles both flat files and subfolders)
-        for file_path in job_path.rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in ['.yaml', '.html']:
-                # Split filename by periods
-                filename_parts = file_path.stem.split('.')
-                
-                # Check if filename has exactly 4 parts (timestamp.id.company.title)
-                if len(filename_parts) == 4:
-                    # Extract the ID (second element, index 1)
-                    job_id = filename_parts[1]
-                    ids.add(job_id)
-                    logger.debug(f"Found ID {job_id} in file: {file_path.name}")
-                else:
-                    logger.debug(f"Skipping file with unexpected format: {file_path.name}")
+        for entry in _scandir_recursive(job_path):
+            name = entry.name
+            # Common case first: '.yaml' and '.html' are both 5 characters, and a
+            # valid name (timestamp.id.company.title.ext) has exactly 4 periods
+            if name[-5:].lower() not in ('.yaml', '.html') or name.count('.') != 4:
+                continue
+
+            # Extract the ID (second element) by slicing between the first two periods
+            d1 = name.find('.')
+            d2 = name.find('.', d1 + 1)
+            ids.add(name[d1 + 1:d2])
     
     except Exception as e:
         logger.error(f"Error scanning directory {job_path}: {str(e)}", exc_info=True)
@@ -155,11 +262,97 @@ def get_all_ids(job_path:Path = None) -> list:
 
 
 
+def load_id_index(job_path:Path) -> set | None:
+    """
+    Read the sidecar ID index (`.id_index.txt`, one job ID per line) kept in job_path,
+    so existing IDs can be collected without rescanning every job file.
+    Delete the index file to force a full rescan via get_all_ids().
+
+    Args:
+        job_path (Path): the jobs directory holding the index file.
+
+    Returns:
+        set: job IDs in the index, or None if the index file does not exist.
+    """
+    index_file = Path(job_path) / ID_INDEX_FILENAME
+    try:
+        with open(index_file, 'r', encoding='utf-8') as f:
+            return {line.strip() for line in f if line.strip()}
+    except FileNotFoundError:
+        return None
+
+
+def write_id_index(job_path:Path, job_ids) -> None:
+    """
+    Write the sidecar ID index in job_path from scratch with the given job IDs, one per line.
+    An empty index file is still written, so an empty archive isn't rescanned on every load().
+    """
+    with open(Path(job_path) / ID_INDEX_FILENAME, 'w', encoding='utf-8') as f:
+        f.write(''.join(f'{job_id}\n' for job_id in sorted(job_ids)))
+
+
+def append_id_index(job_path:Path, *job_ids:str) -> None:
+    """
+    Append one or more job IDs to the sidecar ID index in job_path, if the index exists.
+    Append-only, so recording a newly saved job is O(1) regardless of archive size.
+    A missing index is left missing: an index holding only the new IDs would hide every
+    other saved job, while load() rebuilds a missing index from all job files.
+    """
+    if not job_ids: return
+    try:
+        fd = os.open(Path(job_path) / ID_INDEX_FILENAME, os.O_WRONLY | os.O_APPEND)
+    except FileNotFoundError:
+        return
+    with open(fd, 'w', encoding='utf-8') as f:
+        f.write(''.join(f'{job_id}\n' for job_id in job_ids))
+
+
+
+def _fetch_job_page(link:str) -> tuple:
+    """
+    Fetch a public LinkedIn job page (no access token needed) using the shared session.
+    The body is streamed in 64KB chunks into a single buffer, and only read at all for HTTP 200.
+
+    Returns:
+        tuple: (status_code, html_bytes, encoding)
+    """
+    logger.debug(f"Fetching job description from: {link}")
+    with _SESSION.get(link, timeout=10, stream=True) as response:
+        if response.status_code != 200:
+            return response.status_code, b'', None
+        buffer = io.BytesIO()
+        for chunk in response.iter_content(64 * 1024):
+            buffer.write(chunk)
+        return response.status_code, buffer.getvalue(), response.encoding
+
+
+
+def _fetch_job_pages(jobs:list):
+    """
+    Fetch the job page of each job on FETCH_WORKERS threads, yielding (job, future) in job order.
+    Only FETCH_WINDOW fetches run ahead of the caller, so pages are not all held in memory at once.
+    """
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        pending = deque()
+        for job in jobs:
+            pending.append((job, executor.submit(_fetch_job_page, job['link'])))
+            if len(pending) >= FETCH_WINDOW:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+
 def load(gmail_address:str = None, gmail_app_password:str = None):
     logger.info("Starting job queue loading process")
     
-    # Gmail credentials
-    load_dotenv()
+    # Gmail credentials; .env is only parsed once per process, and not at all
+    # when the credentials were passed in or are already in the environment
+    global _ENV_LOADED
+    if not _ENV_LOADED and not ((gmail_address or os.environ.get('GMAIL_ADDRESS')) and
+                                (gmail_app_password or os.environ.get('GMAIL_APP_PASSWORD'))):
+        load_dotenv()
+        _ENV_LOADED = True
     if not gmail_address: gmail_address = os.getenv('GMAIL_ADDRESS')
     if not gmail_app_password: gmail_app_password = os.getenv('GMAIL_APP_PASSWORD')
     
@@ -200,32 +393,36 @@ def load(gmail_address:str = None, gmail_app_password:str = None):
     
     file_count = 0
 
-    # collect all existing IDs
-    existing_ids = get_all_ids()
+    # collect all existing IDs from the sidecar index, rebuilding it with a full scan if missing
+    existing_ids = load_id_index(job_files)
+    if existing_ids is None:
+        logger.info("ID index not found, rebuilding from job files")
+        existing_ids = set(get_all_ids(job_files))
+        write_id_index(job_files, existing_ids)
 
 
-    # For each job, fetch linkedin page html and parse job details
-    for i, job in enumerate(jobs):
-        link = job.get('link', None)
-        id = job.get('id', None)
-        title = job.get('title', None)
-        company = job.get('company', None)
-        logger.info(f"Processing job {i+1}/{len(jobs)}: {title} at {company} (ID: {id})")
+    # Build the work list once: only new jobs with a link, id and title need their page fetched
+    todo = [job for job in jobs
+            if job.get('id') and job.get('id') not in existing_ids and job.get('link') and job.get('title')]
+    already_saved = sum(1 for job in jobs if job.get('id') in existing_ids)
+    missing_data = len(jobs) - len(todo) - already_saved
+    logger.info(f"Processing {len(todo)} new jobs; skipping {already_saved} already saved "
+                f"and {missing_data} with missing link/id/title")
 
-        if id in existing_ids: 
-            logger.info(f"    SKIPPING: ID {id} already exists")
-            continue
-        
-        if not link or not id or not title: 
-            logger.warning(f"    SKIPPING: job with missing data: link={bool(link)}, id={bool(id)}, title={bool(title)}")
-            continue
+    # queued root is created once here, so each job only needs a single mkdir below
+    queued_root = job_files / '1_queued'
+    os.makedirs(queued_root, exist_ok=True)
+
+    # Fetch job pages concurrently over the pooled keep-alive session, then
+    # parse and save each one on this thread, in the original job order
+    for job, page in _fetch_job_pages(todo):
+        id = job['id']
 
         # open public webpage (no access token needed) and collect JD html
-        logger.debug(f"Fetching job description from: {link}")
         try:
-            response = requests.get(job.get('link'), headers={})
-            if response.status_code != 200: 
-                logger.warning(f"Failed to fetch job page: HTTP {response.status_code}")
+            status_code, html_bytes, encoding = page.result()
+            if status_code != 200: 
+                logger.warning(f"Failed to fetch job page: HTTP {status_code}")
                 continue
         except Exception as e:
             logger.error(f"Error fetching job page: {str(e)}")
@@ -233,7 +430,10 @@ def load(gmail_address:str = None, gmail_app_password:str = None):
 
         # try to get the Job Description, if possible:
         try:
-            jd = parse_linkedin_emails.parse_job_description(response.text)
+            # decode the page once; the raw bytes are what gets saved to disk
+            html_text = html_bytes.decode(encoding or 'utf-8', 'replace')
+            jd = parse_linkedin_emails.parse_job_description(html_text)
+            del html_text
             # Sanitize the job description before wrapping in LiteralStr
             jd_sanitized = sanitize_text_for_yaml(jd.strip() or '')
             job['description'] = LiteralStr(jd_sanitized)
@@ -242,48 +442,40 @@ def load(gmail_address:str = None, gmail_app_password:str = None):
             logger.error(f"Error parsing job description: {str(e)}")
             job['description'] = LiteralStr('')
 
-        # Sanitize all job data before saving
-        job_sanitized = sanitize_job_data(job)
-        
+        # Sanitize all job data before saving, then unpack the fields used below once
+        job_sanitized = _sanitize_flat(job)
+        company = job_sanitized.get('company')
+        title = job_sanitized.get('title')
+        date_received = job_sanitized.get('date_received')
+    
         # set processing time, so all files have same timestamp
-        proctime = datetime.fromisoformat(job_sanitized.get('date_received')).strftime("%Y%m%d%H%M%S")
-
-        # sanitize company/title for safe filenames
-        def _sanitize_fn(s: str) -> str:
-            if not s:
-                return 'NA'
-            # First apply text sanitization
-            s = sanitize_text_for_yaml(s)
-            # replace path separators, dots and other unsafe chars with underscores
-            out = re.sub(r'[\\/:*?"<>|.]+', '_', s)
-            # also replace control chars and other non-printables (disallow dot)
-            out = re.sub(r'[^\w\- ]+', '_', out)
-            # collapse whitespace to single space
-            out = re.sub(r'\s+', ' ', out).strip()
-            out = out.replace(' _ ', ' ')
-            # limit length
-            return out[:200]
-
-        company = _sanitize_fn(company)
-        title = _sanitize_fn(title)
+        proctime = datetime.fromisoformat(date_received).strftime("%Y%m%d%H%M%S")
+
+        # company/title are already YAML-sanitized above, so only make them filename-safe
+        company = _to_filename(company or 'NA')
+        title = _to_filename(title or 'NA')
 
         # Create subfolder for this job in queued directory
         # Format: Company.Position.id.timestamp
         subfolder_name = f"{company}.{title}.{id}.{proctime}"
-        job_subfolder = job_files / '1_queued' / subfolder_name
-        job_subfolder.mkdir(exist_ok=True)
-        
+        job_subfolder = queued_root / subfolder_name
+        try:
+            os.mkdir(job_subfolder)
+        except FileExistsError:
+            pass
+    
         logger.info(f"Created job subfolder: {job_subfolder}")
 
         # Save files in the subfolder
-        with open(job_subfolder / f'{proctime}.{id}.{company}.{title}.yaml', 'w', encoding='utf-8') as f:
-            yaml.safe_dump(job_sanitized, f, sort_keys=False, allow_unicode=True)
+        with open(job_subfolder / f'{proctime}.{id}.{company}.{title}.yaml', 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            yaml.dump(job_sanitized, f, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
             file_count += 1
+        append_id_index(job_files, id)
 
-        with open(job_subfolder / f'{proctime}.{id}.{company}.{title}.html', 'w', encoding='utf-8') as f:
-            f.write(response.text)
+        with open(job_subfolder / f'{proctime}.{id}.{company}.{title}.html', 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(html_bytes)
             file_count += 1
-    
+
     print(f'Parsed {len(jobs)} jobs from {len(emails)} emails, and saved to {file_count} files.')
     return None
 
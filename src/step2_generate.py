@@ -1,29 +1,20 @@
-import os, re, yaml, logging, sys, time
+import os, re, yaml, logging, sys, time, threading, shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache
 from dotenv import load_dotenv
 from pathlib import Path
 from datetime import datetime
 
-# Handle imports for different contexts (standalone vs web app)
-try:
-    from src.utils import logging_setup
-    from src.utils.version import get_version
-except ImportError:
-    # When called from web app context, src is not in the module path
-    try:
-        from utils import logging_setup
-        from utils.version import get_version
-    except ImportError:
-        # Last resort - add src to path and try again
-        import sys
-        from pathlib import Path
-        src_path = str(Path(__file__).parent)
-        if src_path not in sys.path:
-            sys.path.insert(0, src_path)
-        from utils import logging_setup
-        from utils.version import get_version
-
-# Get current version
-VERSION = get_version()
+# Import utils from this file's directory whichever way the module was loaded (script, web app,
+# or as src.step2_generate), so it is found on the first try and loaded under one name only
+_SRC_DIR = Path(__file__).parent
+if str(_SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(_SRC_DIR))
+from utils import logging_setup
+from utils.version import get_version
+
+# Current version, read from pyproject.toml the first time a footer needs it rather than on import
+_version = lru_cache(maxsize=1)(get_version)
 
 # Import modular generation system
 try:
@@ -37,11 +28,31 @@ except ImportError as e:
 # Set up logger for this module
 logger = logging_setup.get_logger(__name__)
 
+# Resume and job folders, resolved once rather than rebuilt by every function that reads or moves files
+RESUMES_DIR = _SRC_DIR / 'resumes'
+JOBS_DIR = _SRC_DIR / 'jobs'
+QUEUED_DIR = JOBS_DIR / '1_queued'
+GENERATED_DIR = JOBS_DIR / '2_generated'
+
+# Prefer the LibYAML-backed loader for job and resume files when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+    logger.warning("LibYAML bindings not available, falling back to the pure-Python YAML loader")
+
 def force_flush_logs():
     """Force flush all logging handlers and stdout to ensure immediate output"""
     return logging_setup.force_flush_logs()
 
 
+# sanitize_filename maps filename-unsafe characters and whitespace (the code points str.isspace()
+# and regex \s accept) to '_' in one str.translate pass, then collapses the runs of underscores
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*'
+                                              '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003'
+                                              '\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000', '_'))
+_SANITIZE_RUNS = re.compile(r'__+')
+
 def sanitize_filename(text):
     """
     Sanitize text for use in filenames and directory names.
@@ -50,15 +61,18 @@ def sanitize_filename(text):
     if not text:
         return "Unknown"
     
-    # Replace problematic characters with underscores
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', text)
-    # Replace spaces and multiple underscores with single underscore
-    sanitized = re.sub(r'[\s_]+', '_', sanitized)
+    # Replace problematic characters and whitespace with underscores
+    sanitized = text.translate(_SANITIZE_TABLE)
+    # Collapse runs of underscores into a single underscore
+    sanitized = _SANITIZE_RUNS.sub('_', sanitized)
     # Remove leading/trailing underscores and limit length
     return sanitized.strip('_')[:50]
 
 
 
+# Parsed resume files, keyed by path, as (st_mtime_ns, resume dict)
+_RESUME_CACHE = {}
+
 def load_resume_file(resume_file: Path | str = 'stephen') -> dict:
     """
     Loads the named "resume" file from the `src/resumes` directory, and returns the parsed YAML data as a dictionary.
@@ -77,27 +91,36 @@ def load_resume_file(resume_file: Path | str = 'stephen') -> dict:
     if isinstance(resume_file, str):
         if not resume_file.endswith('.yaml'):
             resume_file = f"{resume_file}.yaml"
-        resume_path = Path(__file__).parent / 'resumes' / resume_file
+        resume_path = RESUMES_DIR / resume_file
     elif isinstance(resume_file, Path):
         resume_path = resume_file
     else: 
         logger.error(f"Invalid resume_file type: {type(resume_file)}")
         raise ValueError(f"Parameter 'resume_file' must be type str or Path, you provided: {type(resume_file)}")
         
-    # Check if file exists
-    if not resume_path.exists():
+    # Check if file exists (the stat result also keys the parsed-resume cache)
+    try:
+        mtime_ns = resume_path.stat().st_mtime_ns
+    except OSError:
         logger.error(f"Resume file not found: {resume_path.resolve()}")
         raise ValueError(f"Parameter 'resume_file' did not resolve to a resume file: {resume_path.resolve()}")
+
+    # Reuse the parsed resume if the file hasn't changed since it was last loaded
+    cache_key = str(resume_path)
+    cached = _RESUME_CACHE.get(cache_key)
+    if cached and cached[0] == mtime_ns:
+        logger.info(f"Using cached resume for: {cached[1].get('name', 'Unknown')}")
+        return cached[1]
         
     # Load and parse YAML
     try:
-        with open(resume_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            # Replace tabs with spaces to fix YAML parsing issues
-            content = content.replace('\t', '  ')
-            resume_data = yaml.safe_load(content)
+        # Replace tabs with spaces to fix YAML parsing issues; done on the raw bytes
+        # (tab is a single byte in UTF-8) and handed straight to the loader, which decodes it
+        content = resume_path.read_bytes().replace(b'\t', b'  ')
+        resume_data = yaml.load(content, Loader=_Loader)
             
         logger.info(f"Successfully loaded resume for: {resume_data.get('name', 'Unknown')}")
+        _RESUME_CACHE[cache_key] = (mtime_ns, resume_data)
         return resume_data
         
     except Exception as e:
@@ -106,6 +129,60 @@ def load_resume_file(resume_file: Path | str = 'stephen') -> dict:
 
 
 
+def _yaml_names(path: str):
+    """
+    Yield the names of all `.yaml` files under path, using os.scandir so directory checks
+    come from the cached directory entry instead of a stat() per file. Subdirectories go on
+    an explicit stack rather than a chain of nested generators.
+    """
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.yaml'):
+                    yield entry.name
+
+
+def _queued_yaml_by_id(queued_dir: Path, job_id: str = None) -> dict[str, Path]:
+    """
+    Maps each job ID in queued_dir to its job `.yaml` file, named like `timestamp.id.company.title.yaml`,
+    with one os.scandir pass over the flat files and one per subfolder. Flat files (legacy format)
+    win over subfolders when an ID appears in both. When job_id is given only that job is mapped,
+    and subfolders (named `company.title.id.timestamp`) without it in their name are never opened.
+    """
+    yaml_by_id = {}
+    subfolders = []
+    with os.scandir(queued_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                if job_id is None or f".{job_id}." in entry.name:
+                    subfolders.append(entry.path)
+            elif entry.name.endswith('.yaml'):
+                filename_parts = entry.name[:-5].split('.', 2)
+                if len(filename_parts) >= 2 and (job_id is None or filename_parts[1] == job_id):
+                    yaml_by_id.setdefault(filename_parts[1], Path(entry.path))
+    for subfolder in subfolders:
+        with os.scandir(subfolder) as it:
+            for entry in it:
+                if entry.name.endswith('.yaml'):
+                    filename_parts = entry.name[:-5].split('.', 2)
+                    if len(filename_parts) >= 2 and (job_id is None or filename_parts[1] == job_id):
+                        yaml_by_id.setdefault(filename_parts[1], Path(entry.path))
+    return yaml_by_id
+
+
+# Threads used by load_queued_jobs to read and parse queued job files concurrently
+JOB_LOAD_WORKERS = 8
+
+def _load_job_yaml(yaml_file: Path):
+    """
+    Reads and parses one job YAML file.
+    """
+    return yaml.load(yaml_file.read_bytes(), Loader=_Loader)
+
+
 def load_queued_jobs(force:bool = False, specific_job_id: str = None) -> list[dict]:
     """
     Loads all jobs from the `src/jobs/1_queued` directory, and returns them as a list of dictionaries.
@@ -122,9 +199,8 @@ def load_queued_jobs(force:bool = False, specific_job_id: str = None) -> list[di
     """
     logger.info(f"Loading queued jobs (force={force}, specific_job_id={specific_job_id})")
     
-    jobs_dir = Path(__file__).parent / 'jobs'
-    exclude_dirs = [d.name for d in jobs_dir.iterdir() if d.is_dir() and d.name != '1_queued']
-    queued_dir = jobs_dir / '1_queued'
+    jobs_dir = JOBS_DIR
+    queued_dir = QUEUED_DIR
     
     if not queued_dir.exists(): 
         logger.error(f"Queued directory not found: {queued_dir.resolve()}")
@@ -136,37 +212,53 @@ def load_queued_jobs(force:bool = False, specific_job_id: str = None) -> list[di
     # If not forcing, collect IDs from other directories to exclude
     if not force:
         logger.info("Checking for previously processed jobs")
-        for exclude_dir in exclude_dirs:
-            exclude_path = jobs_dir / exclude_dir
-            if exclude_path.exists():
-                # Check both flat files and subdirectories for job IDs
-                for file_path in exclude_path.rglob('*.yaml'):
-                    # Extract job ID from filename (format: timestamp.id.company.title.yaml)
-                    filename_parts = file_path.stem.split('.')
-                    if len(filename_parts) >= 2:
-                        job_id = filename_parts[1]
-                        processed_ids.add(job_id)
-        logger.info(f"Found {len(processed_ids)} previously processed job IDs")
-    
-    # Load jobs from queued directory - now checking both flat files and subfolders
+        with os.scandir(jobs_dir) as it:
+            exclude_paths = [entry.path for entry in it if entry.is_dir() and entry.name != '1_queued']
+        # Check both flat files and subdirectories for job IDs, taken straight from the
+        # filename strings (format: timestamp.id.company.title.yaml)
+        file_ids = (filename_parts[1]
+                    for exclude_path in exclude_paths
+                    for name in _yaml_names(exclude_path)
+                    if len(filename_parts := name[:-5].split('.', 2)) >= 2)
+        if specific_job_id:
+            # Only the requested ID matters, so the walk can stop at its first match
+            processed_ids = {specific_job_id} if specific_job_id in file_ids else set()
+            logger.info(f"Job {specific_job_id} previously processed: {bool(processed_ids)}")
+        else:
+            processed_ids = set(file_ids)
+            logger.info(f"Found {len(processed_ids)} previously processed job IDs")
+    
+    # Find jobs in queued directory - now checking both flat files and subfolders - as
+    # (yaml_file, job_id, error message) candidates, which are all loaded together below
     jobs_found = 0
+    candidates = []
+
+    # One pass over the queued directory sorts its entries into flat files and subfolders
+    flat_files = []
+    subfolders = []
+    with os.scandir(queued_dir) as it:
+        for entry in it:
+            if entry.is_dir():
+                subfolders.append(Path(entry.path))
+            elif entry.name.endswith('.yaml'):
+                flat_files.append(Path(entry.path))
     
     # First check for any remaining flat files (backward compatibility)
-    flat_files = list(queued_dir.glob('*.yaml'))
     if flat_files:
         logger.info(f"Found {len(flat_files)} flat queued job files (legacy format)")
         
         for yaml_file in flat_files:
             try:
                 # Extract job ID from filename
-                filename_parts = yaml_file.stem.split('.')
-                if len(filename_parts) >= 2:
-                    job_id = filename_parts[1]
-                    
-                    # If specific job ID requested, skip if this isn't it
-                    if specific_job_id and job_id != specific_job_id:
-                        continue
-                    
+                filename_parts = yaml_file.stem.split('.', 2)
+                job_id = filename_parts[1] if len(filename_parts) >= 2 else None
+                
+                # If specific job ID requested, skip if this isn't it - before the file is opened,
+                # so names without an ID never get parsed either
+                if specific_job_id and job_id != specific_job_id:
+                    continue
+                
+                if job_id is not None:
                     jobs_found += 1
                     
                     # Skip if already processed (unless forcing)
@@ -174,47 +266,42 @@ def load_queued_jobs(force:bool = False, specific_job_id: str = None) -> list[di
                         logger.info(f"Skipping already processed job: {job_id}")
                         continue
                 
-                # Load the YAML file
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    job_data = yaml.safe_load(f)
-                    if job_data: 
-                        jobs.append(job_data)
-                        logger.info(f"Loaded job: {job_data.get('company', 'Unknown')} - {job_data.get('title', 'Unknown')}")
-                        
-                        # If we found the specific job, we can return early
-                        if specific_job_id and job_id == specific_job_id:
-                            logger.info(f"Found specific job ID {specific_job_id}, returning early")
-                            return jobs
-                        
+                # Queue the YAML file to be loaded
+                candidates.append((yaml_file, job_id, f"Error loading job file {yaml_file}"))
+                
             except Exception as e:
                 logger.error(f"Error loading job file {yaml_file}: {str(e)}", exc_info=True)
                 continue
     
     # Now check for subfolder structure (new format)
-    subfolders = [d for d in queued_dir.iterdir() if d.is_dir()]
     if subfolders:
         logger.info(f"Found {len(subfolders)} queued job subfolders")
         
         for subfolder in subfolders:
+            # Subfolders are named company.title.id.timestamp, so when a specific job is
+            # requested, any folder without that id in its name can be skipped unopened
+            if specific_job_id and f".{specific_job_id}." not in subfolder.name:
+                continue
             try:
-                # Find YAML files in the subfolder
-                yaml_files = list(subfolder.glob('*.yaml'))
-                if not yaml_files:
+                # Take the first YAML file in the subfolder (should only be one), stopping the scan there
+                with os.scandir(subfolder) as it:
+                    yaml_path = next((entry.path for entry in it
+                                      if entry.name.endswith('.yaml') and entry.is_file()), None)
+                if yaml_path is None:
                     logger.warning(f"No YAML files found in subfolder: {subfolder.name}")
                     continue
-                
-                # Take the first YAML file (should only be one per subfolder)
-                yaml_file = yaml_files[0]
+                yaml_file = Path(yaml_path)
                 
                 # Extract job ID from filename
-                filename_parts = yaml_file.stem.split('.')
-                if len(filename_parts) >= 2:
-                    job_id = filename_parts[1]
-                    
-                    # If specific job ID requested, skip if this isn't it
-                    if specific_job_id and job_id != specific_job_id:
-                        continue
-                    
+                filename_parts = yaml_file.stem.split('.', 2)
+                job_id = filename_parts[1] if len(filename_parts) >= 2 else None
+                
+                # If specific job ID requested, skip if this isn't it - before the file is opened,
+                # so names without an ID never get parsed either
+                if specific_job_id and job_id != specific_job_id:
+                    continue
+                
+                if job_id is not None:
                     jobs_found += 1
                     
                     # Skip if already processed (unless forcing)
@@ -222,22 +309,33 @@ def load_queued_jobs(force:bool = False, specific_job_id: str = None) -> list[di
                         logger.info(f"Skipping already processed job: {job_id}")
                         continue
                 
-                # Load the YAML file
-                with open(yaml_file, 'r', encoding='utf-8') as f:
-                    job_data = yaml.safe_load(f)
-                    if job_data: 
-                        jobs.append(job_data)
-                        logger.info(f"Loaded job: {job_data.get('company', 'Unknown')} - {job_data.get('title', 'Unknown')}")
-                        
-                        # If we found the specific job, we can return early
-                        if specific_job_id and job_id == specific_job_id:
-                            logger.info(f"Found specific job ID {specific_job_id}, returning early")
-                            return jobs
-                        
+                # Queue the YAML file to be loaded
+                candidates.append((yaml_file, job_id, f"Error loading job from subfolder {subfolder}"))
+                
             except Exception as e:
                 logger.error(f"Error loading job from subfolder {subfolder}: {str(e)}", exc_info=True)
                 continue
     
+    # Read and parse the candidates on a small thread pool so their file reads overlap,
+    # then take the results in the order the files were found
+    with ThreadPoolExecutor(max_workers=JOB_LOAD_WORKERS) as pool:
+        futures = [pool.submit(_load_job_yaml, yaml_file) for yaml_file, _, _ in candidates]
+        for future, (_, job_id, error_message) in zip(futures, candidates):
+            try:
+                job_data = future.result()
+                if job_data: 
+                    jobs.append(job_data)
+                    logger.info(f"Loaded job: {job_data.get('company', 'Unknown')} - {job_data.get('title', 'Unknown')}")
+                    
+                    # If we found the specific job, we can return early
+                    if specific_job_id and job_id == specific_job_id:
+                        logger.info(f"Found specific job ID {specific_job_id}, returning early")
+                        return jobs
+                    
+            except Exception as e:
+                logger.error(f"{error_message}: {str(e)}", exc_info=True)
+                continue
+    
     if specific_job_id and not jobs:
         logger.warning(f"Specific job ID {specific_job_id} not found in queued jobs")
     
@@ -261,7 +359,8 @@ def validate_bullet_length(text, max_chars=180):
     is_valid = char_count <= max_chars
     
     # Rough estimation: ~90 chars per line for Calibri 10.5pt in 728px container
-    estimated_lines = max(1, (char_count + 89) // 90)
+    # (the quotient is only 0 for empty text, which still counts as one line)
+    estimated_lines = (char_count + 89) // 90 or 1
     
     return is_valid, char_count, estimated_lines
 
@@ -273,75 +372,111 @@ def structure_resume(resume:dict) -> str:
     if not resume:
         return ""
     
-    sections = []
-    
+    return "\n".join(_iter_resume_lines(resume))
+
+
+def _iter_resume_lines(resume:dict):
+    """
+    Yields the lines of `structure_resume()` output, section by section, so the caller can build the
+    whole string with a single join.
+    """
     # Basic info
-    if resume.get('name'):
-        sections.append(f"Name: {resume['name']}")
-    if resume.get('location'):
-        sections.append(f"Location: {resume['location']}")
+    if name := resume.get('name'):
+        yield f"Name: {name}"
+    if location := resume.get('location'):
+        yield f"Location: {location}"
     
     # Summary
-    if resume.get('Summary'):
-        sections.append(f"\nSummary:\n{resume['Summary']}")
+    if summary := resume.get('Summary'):
+        yield f"\nSummary:\n{summary}"
     
     # Contact information
-    if resume.get('contacts'):
-        sections.append("\nContact Information:")
-        for contact in resume['contacts']:
-            if contact.get('name') and contact.get('label'):
-                contact_line = f"- {contact['name']}: {contact['label']}"
-                if contact.get('url'):
-                    contact_line += f" (URL: {contact['url']})"
-                if contact.get('icon'):
-                    # Handle local SVG icons - construct path for web server serving
-                    icon_path = f"/resumes/icons/{contact['icon']}"
-                    contact_line += f" (Icon: {icon_path})"
-                sections.append(contact_line)
+    if contacts := resume.get('contacts'):
+        yield "\nContact Information:"
+        yield from _iter_contact_lines(contacts)
     
     # Skills
-    if resume.get('skills'):
-        sections.append(f"\nSkills:\n{', '.join(resume['skills'])}")
+    if skills := resume.get('skills'):
+        yield "\nSkills:\n" + ', '.join(skills)
     
     # Experience
-    if resume.get('experience'):
-        sections.append("\nExperience:")
-        for exp in resume['experience']:
-            sections.append(f"\n{exp.get('company_name', 'Unknown Company')} ({exp.get('dates', 'Unknown dates')})")
-            if exp.get('company_desc'):
-                sections.append(f"Company: {exp['company_desc']}")
-            
-            if exp.get('roles'):
-                for role in exp['roles']:
-                    sections.append(f"\nRole: {role.get('role', 'Unknown role')} ({role.get('dates', 'Unknown dates')})")
-                    if role.get('bullets'):
-                        for bullet in role['bullets']:
-                            sections.append(f"• {bullet}")
+    if experience := resume.get('experience'):
+        yield "\nExperience:"
+        for exp in experience:
+            yield from _iter_experience_lines(exp)
     
     # Education
-    if resume.get('education'):
-        sections.append("\nEducation:")
-        for edu in resume['education']:
+    if education := resume.get('education'):
+        yield "\nEducation:"
+        for edu in education:
             course = edu.get('course', 'Unknown course')
             school = edu.get('school', 'Unknown school')
             dates = edu.get('dates', 'Unknown dates')
-            sections.append(f"- {course} - {school} ({dates})")
+            yield f"- {course} - {school} ({dates})"
     
     # Awards and keynotes
-    if resume.get('awards_and_keynotes'):
-        sections.append("\nAwards and Keynotes:")
-        for award in resume['awards_and_keynotes']:
+    if awards := resume.get('awards_and_keynotes'):
+        yield "\nAwards and Keynotes:"
+        for award in awards:
             award_name = award.get('award', 'Unknown award')
             dates = award.get('dates', 'Unknown dates')
-            sections.append(f"- {award_name} ({dates})")
+            yield f"- {award_name} ({dates})"
     
     # Passions
-    if resume.get('passions'):
-        sections.append(f"\nPassions:\n{chr(10).join(f'• {passion}' for passion in resume['passions'])}")
+    if passions := resume.get('passions'):
+        yield "\nPassions:\n" + "\n".join(map('• {}'.format, passions))
+
+
+def _iter_contact_lines(contacts:list):
+    for contact in contacts:
+        name = contact.get('name')
+        label = contact.get('label')
+        if name and label:
+            contact_line = f"- {name}: {label}"
+            if url := contact.get('url'):
+                contact_line += f" (URL: {url})"
+            if icon := contact.get('icon'):
+                # Handle local SVG icons - construct path for web server serving
+                contact_line += f" (Icon: /resumes/icons/{icon})"
+            yield contact_line
+
+
+def _iter_experience_lines(exp:dict):
+    yield f"\n{exp.get('company_name', 'Unknown Company')} ({exp.get('dates', 'Unknown dates')})"
+    if company_desc := exp.get('company_desc'):
+        yield f"Company: {company_desc}"
     
-    return "\n".join(sections)
+    for role in exp.get('roles') or ():
+        yield f"\nRole: {role.get('role', 'Unknown role')} ({role.get('dates', 'Unknown dates')})"
+        if bullets := role.get('bullets'):
+            yield from map('• {}'.format, bullets)
 
 
+# Last (resume, structure_resume(resume)) pair; load_resume_file returns the same dict
+# for an unchanged file, so a batch of jobs structures the resume only once
+_STRUCTURED_RESUME = (None, None)
+
+def _structured_resume(resume:dict) -> str:
+    """
+    Returns structure_resume(resume), reusing the previous result when called again with the same resume dict.
+    """
+    global _STRUCTURED_RESUME
+    if _STRUCTURED_RESUME[0] is not resume:
+        _STRUCTURED_RESUME = (resume, structure_resume(resume))
+    return _STRUCTURED_RESUME[1]
+
+
+# Job fields listed by structure_job, in output order, with their labels
+_JOB_FIELD_LABELS = (
+    ('title', 'Job Title'),
+    ('company', 'Company'),
+    ('location', 'Location'),
+    ('salary', 'Salary'),
+    ('link', 'Job Link'),
+    ('date_received', 'Date Received'),
+    ('tags', 'Tags'),
+)
+
 def structure_job(job:dict) -> str:
     """
     Takes a job dictionary and returns a string representation of the job, structured for LLM consumption.
@@ -349,23 +484,8 @@ def structure_job(job:dict) -> str:
     if not job:
         return ""
     
-    sections = []
-    
     # Basic job info
-    if job.get('title'):
-        sections.append(f"Job Title: {job['title']}")
-    if job.get('company'):
-        sections.append(f"Company: {job['company']}")
-    if job.get('location'):
-        sections.append(f"Location: {job['location']}")
-    if job.get('salary'):
-        sections.append(f"Salary: {job['salary']}")
-    if job.get('link'):
-        sections.append(f"Job Link: {job['link']}")
-    if job.get('date_received'):
-        sections.append(f"Date Received: {job['date_received']}")
-    if job.get('tags'):
-        sections.append(f"Tags: {job['tags']}")
+    sections = [f"{label}: {job[key]}" for key, label in _JOB_FIELD_LABELS if job.get(key)]
     
     # Job description
     if job.get('description'):
@@ -375,6 +495,108 @@ def structure_job(job:dict) -> str:
 
 
 
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str, timeout: float):
+    """
+    Returns an OpenAI client for the key, created once so later calls reuse its HTTPS connection pool.
+    """
+    import openai
+    return openai.OpenAI(api_key=api_key, timeout=timeout)
+
+
+@lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str):
+    """
+    Returns an Anthropic client for the key, created once so later calls reuse its HTTPS connection pool.
+    """
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def _call_openai(llm_model:str, llm_api_key:str, messages:list, section_suffix:str) -> str:
+    """
+    Sends messages to OpenAI's chat completions API, retrying on failure, and returns the response text.
+    """
+    logger.info(f"Starting OpenAI API call with 6-minute timeout and 10 retries{section_suffix}")
+    start_time = time.time()
+
+    # Simple retry logic: 10 attempts with 6-minute timeout each, backing off exponentially between them
+    max_retries = 10
+    timeout_seconds = 360  # 6 minutes
+    max_backoff_seconds = 60
+
+    # One client (and connection pool) for every attempt; the timeout is set on the client
+    client = _get_openai_client(llm_api_key, float(timeout_seconds))
+
+    for attempt in range(max_retries):
+        try:
+            attempt_start = time.time()
+            logger.info(f"Attempt {attempt + 1}/{max_retries} with {timeout_seconds}s timeout{section_suffix}")
+
+            # Use reliable chat.completions API with flex pricing
+            logger.info(f"Making OpenAI API call{section_suffix}...")
+            response = client.chat.completions.create(
+                model=llm_model,
+                max_completion_tokens=32000,
+                messages=messages,
+                service_tier="flex"  # Use flex tier for cheapest rates
+            )
+
+            attempt_time = time.time() - attempt_start
+            total_time = time.time() - start_time
+            result = response.choices[0].message.content
+
+            logger.info(f"LLM response received: {len(result)} characters in {attempt_time:.1f}s (attempt {attempt + 1}, total {total_time:.1f}s){section_suffix}")
+
+            return result
+
+        except Exception as e:
+            attempt_time = time.time() - attempt_start
+            total_time = time.time() - start_time
+
+            if attempt < max_retries - 1:  # Not the last attempt
+                logger.warning(f"Attempt {attempt + 1}/{max_retries} failed after {attempt_time:.1f}s{section_suffix}: {str(e)}")
+                backoff_seconds = min(max_backoff_seconds, 2 ** attempt)
+                logger.info(f"Retrying{section_suffix} in {backoff_seconds} seconds... (attempt {attempt + 2}/{max_retries})")
+
+                # Pause before retry, doubling each time up to max_backoff_seconds
+                time.sleep(backoff_seconds)
+                continue
+            else:  # Final attempt failed
+                logger.error(f"Final attempt {attempt + 1}/{max_retries} failed after {attempt_time:.1f}s (total {total_time:.1f}s){section_suffix}: {str(e)}")
+                raise Exception(f"OpenAI API failed after {max_retries} attempts with 6-minute timeouts (total {total_time:.1f}s)")
+
+
+def _call_anthropic(llm_model:str, llm_api_key:str, messages:list, section_suffix:str) -> str:
+    """
+    Sends messages to Anthropic's messages API and returns the response text.
+    """
+    client = _get_anthropic_client(llm_api_key)
+
+    response = client.messages.create(
+        model=llm_model,
+        max_tokens=4000,
+        temperature=0.7,
+        messages=messages
+    )
+    result = response.content[0].text
+    logger.info(f"LLM response received: {len(result)} characters")
+
+    return result
+
+
+# Provider adapters used by llm_call, keyed by lowercased provider name; each SDK is only
+# imported (by its client factory) the first time its provider is actually used
+_PROVIDER_CALLS = {
+    'openai': _call_openai,
+    'anthropic': _call_anthropic,
+}
+
+
+# Set once llm_call has read the .env file; load_dotenv never overrides variables that
+# are already set, so re-reading it on every call could not change the values used
+_ENV_LOADED = False
+
 def llm_call(llm_provider:str=None, llm_model:str=None, llm_api_key:str=None, sys_prompt:str=None, user_prompt:str=None, section_name:str=None) -> str:
     """
     Executes supplied prompts against the supplied LLM, and returns string response. 
@@ -387,7 +609,10 @@ def llm_call(llm_provider:str=None, llm_model:str=None, llm_api_key:str=None, sy
         user_prompt (str): User prompt for the request
         section_name (str): Optional section name for logging purposes
     """
-    load_dotenv()
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        load_dotenv()
+        _ENV_LOADED = True
     llm_provider = llm_provider if llm_provider else os.getenv("LLM_MODEL_PROVIDER")
     llm_model    = llm_model if llm_model else os.getenv("LLM_MODEL")
     llm_api_key  = llm_api_key if llm_api_key else os.getenv("LLM_API_KEY")
@@ -395,9 +620,6 @@ def llm_call(llm_provider:str=None, llm_model:str=None, llm_api_key:str=None, sy
     section_suffix = f" for {section_name}" if section_name else ""
     logger.info(f"Making LLM call to {llm_provider}/{llm_model}{section_suffix}")
     
-    # Force flush to ensure this log appears immediately
-    force_flush_logs()
-    
     if not llm_api_key or not llm_model or not llm_provider:
         logger.error("LLM configuration missing")
         raise ValueError("LLM configuration missing. Please set LLM_API_KEY, LLM_MODEL, and LLM_MODEL_PROVIDER in your .env file")
@@ -413,96 +635,41 @@ def llm_call(llm_provider:str=None, llm_model:str=None, llm_api_key:str=None, sy
         logger.debug(f"System prompt length: {len(sys_prompt)} characters")
          
     try:
-        if llm_provider.lower() == "openai":
-            import openai
-            
-            logger.info(f"Starting OpenAI API call with 6-minute timeout and 10 retries{section_suffix}")
-            start_time = time.time()
-            
-            # Simple retry logic: 10 attempts with 6-minute timeout each
-            max_retries = 10
-            timeout_seconds = 360  # 6 minutes
-            
-            for attempt in range(max_retries):
-                try:
-                    # Create client with 5-minute timeout
-                    client = openai.OpenAI(
-                        api_key=llm_api_key,
-                        timeout=float(timeout_seconds)
-                    )
-                    
-                    attempt_start = time.time()
-                    logger.info(f"Attempt {attempt + 1}/{max_retries} with {timeout_seconds}s timeout{section_suffix}")
-                    
-                    # Use reliable chat.completions API with flex pricing
-                    logger.info(f"Making OpenAI API call{section_suffix}...")
-                    response = client.chat.completions.create(
-                        model=llm_model,
-                        max_completion_tokens=32000,
-                        messages=messages,
-                        service_tier="flex",  # Use flex tier for cheapest rates
-                        timeout=timeout_seconds
-                    )
-                    
-                    attempt_time = time.time() - attempt_start
-                    total_time = time.time() - start_time
-                    result = response.choices[0].message.content
-                    
-                    logger.info(f"LLM response received: {len(result)} characters in {attempt_time:.1f}s (attempt {attempt + 1}, total {total_time:.1f}s){section_suffix}")
-                    
-                    # Force flush after LLM response
-                    force_flush_logs()
-                    
-                    return result
-                    
-                except Exception as e:
-                    attempt_time = time.time() - attempt_start
-                    total_time = time.time() - start_time
-                    
-                    if attempt < max_retries - 1:  # Not the last attempt
-                        logger.warning(f"Attempt {attempt + 1}/{max_retries} failed after {attempt_time:.1f}s{section_suffix}: {str(e)}")
-                        logger.info(f"Retrying{section_suffix} in 10 seconds... (attempt {attempt + 2}/{max_retries})")
-                        
-                        # Brief pause before retry (10 seconds)
-                        time.sleep(10)
-                        continue
-                    else:  # Final attempt failed
-                        logger.error(f"Final attempt {attempt + 1}/{max_retries} failed after {attempt_time:.1f}s (total {total_time:.1f}s){section_suffix}: {str(e)}")
-                        raise Exception(f"OpenAI API failed after {max_retries} attempts with 6-minute timeouts (total {total_time:.1f}s)")
-            
-        elif llm_provider.lower() == "anthropic":
-            import anthropic
-            client = anthropic.Anthropic(api_key=llm_api_key)
-            
-            response = client.messages.create(
-                model=llm_model,
-                max_tokens=4000,
-                temperature=0.7,
-                messages=messages
-            )
-            result = response.content[0].text
-            logger.info(f"LLM response received: {len(result)} characters")
-            
-            # Force flush after LLM response
-            force_flush_logs()
-            
-            return result
-            
-        else:
+        provider_call = _PROVIDER_CALLS.get(llm_provider.lower())
+        if provider_call is None:
             logger.error(f"Unsupported LLM provider: {llm_provider}")
-            raise ValueError(f"Unsupported LLM provider: {llm_provider}. Supported providers: openai, anthropic")
+            raise ValueError(f"Unsupported LLM provider: {llm_provider}. Supported providers: {', '.join(_PROVIDER_CALLS)}")
+        return provider_call(llm_model, llm_api_key, messages, section_suffix)
             
     except Exception as e:
         logger.error(f"Error in LLM call: {str(e)}", exc_info=True)
-        
-        # Force flush after error
-        force_flush_logs()
-        
         return f"Error generating LLM Request: {str(e)}"
 
 
 
-def llm_generate_custom_resume(resume:dict, job:dict, additional_prompt:str = None) -> str:
+def _find_job_directory(base: Path, job_id: str, company_clean: str, title_clean: str) -> str | None:
+    """
+    Returns the path of the job folder under base, named like `{company}.{title}.{id}.{timestamp}`, or None.
+    Stops at the first folder with exactly that prefix; otherwise falls back to the first folder whose name
+    merely contains the id, company and title, as folders queued by older versions may be named differently.
+    """
+    expected_prefix = f"{company_clean}.{title_clean}.{job_id}."
+    fallback = None
+    try:
+        with os.scandir(base) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(expected_prefix) and entry.is_dir():
+                    return entry.path
+                if (fallback is None and job_id in name and company_clean in name
+                        and title_clean in name and entry.is_dir()):
+                    fallback = entry.path
+    except FileNotFoundError:
+        return None
+    return fallback
+
+
+def llm_generate_custom_resume(resume:dict, job:dict, additional_prompt:str = None, job_str:str = None) -> str:
     """
     Accepts a resume and job, and returns a string containing a custom resume tailored to the job.
     Uses an LLM to generate the resume, and returns the generated resume as a string.
@@ -512,10 +679,29 @@ def llm_generate_custom_resume(resume:dict, job:dict, additional_prompt:str = No
         resume (dict): loaded content from `src/resumes/name.yaml` file.
         job (dict): loaded content from `src/jobs/1_queued/job.yaml` file.
         additional_prompt (str, optional): prompt string to be appended to the standard prompt. 
+        job_str (str, optional): precomputed `structure_job(job)` output, to skip rebuilding it.
 
     Returns:
         str: html resume customized for the supplied job (by the LLM)
     """
+    return llm_generate_custom_resume_with_coverletter(resume, job, additional_prompt, job_str)[0]
+
+
+def llm_generate_custom_resume_with_coverletter(resume:dict, job:dict, additional_prompt:str = None, job_str:str = None) -> tuple[str, str | None]:
+    """
+    Same as `llm_generate_custom_resume()`, but also returns the cover letter when the modular generator
+    rendered one from the same generated sections, so it needn't be generated a second time.
+
+    Args: 
+        resume (dict): loaded content from `src/resumes/name.yaml` file.
+        job (dict): loaded content from `src/jobs/1_queued/job.yaml` file.
+        additional_prompt (str, optional): prompt string to be appended to the standard prompt. 
+        job_str (str, optional): precomputed `structure_job(job)` output, to skip rebuilding it.
+
+    Returns:
+        tuple: (html resume, html cover letter), where the cover letter is None when the legacy generator
+               was used (it writes the cover letter in a separate LLM call)
+    """
     # Check if modular generation is available and enabled
     if MODULAR_AVAILABLE:
         try:
@@ -537,39 +723,24 @@ def llm_generate_custom_resume(resume:dict, job:dict, additional_prompt:str = No
                     title_clean = sanitize_filename(job_title)
                     
                     # Check in queued directory (for active processing)
-                    queued_base = Path(__file__).parent / 'jobs' / '1_queued'
-                    if queued_base.exists():
-                        for job_dir in queued_base.iterdir():
-                            if job_dir.is_dir():
-                                # Check if directory matches expected pattern: {company}.{title}.{id}.{timestamp}
-                                if (job_id in job_dir.name and 
-                                    company_clean in job_dir.name and 
-                                    title_clean in job_dir.name):
-                                    job_directory = str(job_dir)
-                                    logger.info(f"Found job directory for caching: {job_directory}")
-                                    break
+                    job_directory = _find_job_directory(QUEUED_DIR, job_id, company_clean, title_clean)
+                    if job_directory:
+                        logger.info(f"Found job directory for caching: {job_directory}")
                     
                     # If not found in queued, check generated directory
                     if not job_directory:
-                        generated_base = Path(__file__).parent / 'jobs' / '2_generated'
-                        if generated_base.exists():
-                            for job_dir in generated_base.iterdir():
-                                if job_dir.is_dir():
-                                    # Check if directory matches expected pattern: {company}.{title}.{id}.{timestamp}
-                                    if (job_id in job_dir.name and 
-                                        company_clean in job_dir.name and 
-                                        title_clean in job_dir.name):
-                                        job_directory = str(job_dir)
-                                        logger.info(f"Found job directory in generated: {job_directory}")
-                                        break
+                        job_directory = _find_job_directory(GENERATED_DIR, job_id, company_clean, title_clean)
+                        if job_directory:
+                            logger.info(f"Found job directory in generated: {job_directory}")
                 
-                return llm_generate_custom_resume_modular(resume, job, additional_prompt, job_directory)
+                html_resume, html_cover_letter = _generate_modular_documents(resume, job, additional_prompt, job_directory)
+                return html_resume, html_cover_letter or None
         except Exception as e:
             logger.warning(f"Modular generation failed, falling back to legacy: {str(e)}")
     
     # Use legacy generation
     logger.info("Using legacy resume generation")
-    return llm_generate_custom_resume_legacy(resume, job, additional_prompt)
+    return llm_generate_custom_resume_legacy(resume, job, additional_prompt, job_str), None
 
 
 def llm_generate_custom_resume_modular(resume:dict, job:dict, additional_prompt:str = None, job_directory: str = None, use_cache: bool = True) -> str:
@@ -586,6 +757,14 @@ def llm_generate_custom_resume_modular(resume:dict, job:dict, additional_prompt:
     Returns:
         str: html resume customized for the supplied job (by the modular system)
     """
+    return _generate_modular_documents(resume, job, additional_prompt, job_directory, use_cache)[0]
+
+
+def _generate_modular_documents(resume:dict, job:dict, additional_prompt:str = None, job_directory: str = None, use_cache: bool = True) -> tuple[str, str]:
+    """
+    Runs the modular generator once, returning the (html resume, html cover letter) it renders
+    from the same generated sections. Takes the same arguments as `llm_generate_custom_resume_modular()`.
+    """
     try:
         # Create modular generator
         config = get_config()
@@ -599,7 +778,7 @@ def llm_generate_custom_resume_modular(resume:dict, job:dict, additional_prompt:
         
         if result.get('success'):
             logger.info(f"Modular generation successful for job {job_id}")
-            return result.get('html_resume', '')
+            return result.get('html_resume', ''), result.get('html_cover_letter', '')
         else:
             logger.error(f"Modular generation failed: {result.get('error', 'Unknown error')}")
             raise Exception(f"Modular generation failed: {result.get('error', 'Unknown error')}")
@@ -642,7 +821,16 @@ def regenerate_html_from_cached_content(job_directory: str, job_data: dict, resu
         raise
 
 
-def llm_generate_custom_resume_legacy(resume:dict, job:dict, additional_prompt:str = None) -> str:
+@lru_cache(maxsize=1)
+def _example_html() -> str:
+    """
+    Returns the example resume HTML used in the legacy prompt, read from disk once per process.
+    """
+    with open(_SRC_DIR / 'resources' / 'templates' / 'example.resume.html') as fh:
+        return fh.read()
+
+
+def llm_generate_custom_resume_legacy(resume:dict, job:dict, additional_prompt:str = None, job_str:str = None) -> str:
     """
     Legacy resume generation function (original implementation).
     
@@ -650,15 +838,16 @@ def llm_generate_custom_resume_legacy(resume:dict, job:dict, additional_prompt:s
         resume (dict): loaded content from `src/resumes/name.yaml` file.
         job (dict): loaded content from `src/jobs/1_queued/job.yaml` file.
         additional_prompt (str, optional): prompt string to be appended to the standard prompt. 
+        job_str (str, optional): precomputed `structure_job(job)` output, to skip rebuilding it.
 
     Returns:
         str: html resume customized for the supplied job (by the LLM)
     """
 
-    resume_str = structure_resume(resume)
-    job_str = structure_job(job)
-    with open( Path(__file__).parent / 'resources' / 'templates' / 'example.resume.html') as fh:
-        example_html_str = fh.read()
+    resume_str = _structured_resume(resume)
+    if job_str is None:
+        job_str = structure_job(job)
+    example_html_str = _example_html()
 
     sys_prompt = """
     You are a professional resume writer who creates tailored resumes in HTML format. Return ONLY the requested output. 
@@ -730,7 +919,10 @@ Generate the complete HTML resume following the example template structure and C
 
 
 
-def llm_generate_custom_coverletter(resume:dict, job:dict, custom_resume:str, additional_prompt:str = None) -> str:
+# Date format used on the first line of generated cover letters
+COVERLETTER_DATE_FORMAT = '%b. %d, %Y'
+
+def llm_generate_custom_coverletter(resume:dict, job:dict, custom_resume:str, additional_prompt:str = None, job_str:str = None, today:str = None) -> str:
     """
     Accepts the final html output from `llm_generate_custom_resume()`, and uses an LLM to generate a matching
     cover letter.  The cover letter can be addressed to the hiring committee for the company name in the job 
@@ -740,6 +932,8 @@ def llm_generate_custom_coverletter(resume:dict, job:dict, custom_resume:str, ad
         custom_resume (str): html content returned from `llm_generate_custom_resume()`
         job (dict): loaded content from `src/jobs/1_queued/job.yaml` file.
         additional_prompt (str, optional): prompt string to be appended to the standard prompt. 
+        job_str (str, optional): precomputed `structure_job(job)` output, to skip rebuilding it.
+        today (str, optional): date line for the letter, so a batch formats it once; defaults to the current date.
 
     Returns:
         str: html cover letter customized for the supplied job (by the LLM) and matching the style of the custom_resume
@@ -756,7 +950,7 @@ def llm_generate_custom_coverletter(resume:dict, job:dict, custom_resume:str, ad
     
     # Use legacy generation
     logger.info("Using legacy cover letter generation")
-    return llm_generate_custom_coverletter_legacy(resume, job, custom_resume, additional_prompt)
+    return llm_generate_custom_coverletter_legacy(resume, job, custom_resume, additional_prompt, job_str, today)
 
 
 def llm_generate_custom_coverletter_modular(resume:dict, job:dict, custom_resume:str, additional_prompt:str = None) -> str:
@@ -795,7 +989,7 @@ def llm_generate_custom_coverletter_modular(resume:dict, job:dict, custom_resume
         raise
 
 
-def llm_generate_custom_coverletter_legacy(resume:dict, job:dict, custom_resume:str, additional_prompt:str = None) -> str:
+def llm_generate_custom_coverletter_legacy(resume:dict, job:dict, custom_resume:str, additional_prompt:str = None, job_str:str = None, today:str = None) -> str:
     """
     Legacy cover letter generation function (original implementation).
     
@@ -804,16 +998,19 @@ def llm_generate_custom_coverletter_legacy(resume:dict, job:dict, custom_resume:
         job (dict): loaded content from `src/jobs/1_queued/job.yaml` file.
         custom_resume (str): html content returned from `llm_generate_custom_resume()`
         additional_prompt (str, optional): prompt string to be appended to the standard prompt. 
+        job_str (str, optional): precomputed `structure_job(job)` output, to skip rebuilding it.
+        today (str, optional): date line for the letter, so a batch formats it once; defaults to the current date.
 
     Returns:
         str: html cover letter customized for the supplied job (by the LLM) and matching the style of the custom_resume
     """
     
-    job_str = structure_job(job)
+    if job_str is None:
+        job_str = structure_job(job)
     co_name = job['company']+' ' if 'company' in job else ''
     
     coverletter_prefix = f"""
-    {datetime.now().strftime('%b. %d, %Y')}
+    {today or datetime.now().strftime(COVERLETTER_DATE_FORMAT)}
 
     Dear {co_name}hiring team,
     """
@@ -877,17 +1074,19 @@ Generate the complete HTML cover letter using the same CSS classes and structure
     return response
  
 
-def llm_generate_job_summary(job:dict) -> str:
+def llm_generate_job_summary(job:dict, job_str:str = None) -> str:
     """
     Accepts the original job description from LinkedIn and generates a high-level summary, in HTML form. 
 
     Args: 
         job (dict): loaded content from `src/jobs/1_queued/job.yaml` file.
+        job_str (str, optional): precomputed `structure_job(job)` output, to skip rebuilding it.
 
     Returns:
         str: html summary of the job.
     """
-    job_str = structure_job(job)
+    if job_str is None:
+        job_str = structure_job(job)
     
     sys_prompt = f"""
     You are a careful job summarizer; you take job descriptions and prepare a brief summary report using human-readable HTML that reports on:
@@ -908,6 +1107,48 @@ def llm_generate_job_summary(job:dict) -> str:
 
 
 
+# Jobs (and summary calls) generate() runs at once; LLM calls are network-bound, so a few run well in parallel
+LLM_WORKERS = 4
+
+
+
+def _files_with_id(path: Path, id) -> list[Path]:
+    """
+    Returns the files directly under path whose job ID, the second dotted part of
+    names like `timestamp.id.company.title.ext`, equals id. A single os.scandir
+    pass with a split check, no glob pattern compiled or matched per entry.
+    """
+    id = str(id)
+    with os.scandir(path) as it:
+        return [Path(entry.path) for entry in it
+                if entry.name.split('.', 2)[1:2] == [id] and entry.is_file()]
+
+
+def _subdirs_with_id(path: Path, id) -> list[Path]:
+    """
+    Returns the job subfolders directly under path that hold files with the given job ID. Job
+    folders are named `company.title.id.timestamp`, so only folders with `.{id}.` in their
+    name are opened to confirm it, rather than listing every job folder's files.
+    """
+    id_part = f".{id}."
+    with os.scandir(path) as it:
+        candidates = [Path(entry.path) for entry in it if id_part in entry.name and entry.is_dir()]
+    return [subfolder for subfolder in candidates if _files_with_id(subfolder, id)]
+
+
+def _replace_dir(source: Path, destination: Path):
+    """
+    Moves the folder source to destination, replacing any existing folder there. A plain
+    rename is tried first; an existing non-empty destination is only removed if that fails.
+    """
+    try:
+        os.replace(source, destination)
+    except OSError:
+        logger.debug(f"Removing existing folder: {destination}")
+        shutil.rmtree(destination, ignore_errors=True)
+        shutil.move(source, destination)
+
+
 def move_queued_to_errored(id:str) -> bool:
     """
     Accepts an id that has errored during generation, then moves all files in either
@@ -919,42 +1160,31 @@ def move_queued_to_errored(id:str) -> bool:
     
     try:
         # Get the jobs directory
-        jobs_dir = Path(__file__).parent / 'jobs'
-        queued_dir = jobs_dir / '1_queued'
-        generated_dir = jobs_dir / '2_generated'
+        jobs_dir = JOBS_DIR
+        queued_dir = QUEUED_DIR
+        generated_dir = GENERATED_DIR
         errors_dir = jobs_dir / '8_errors'
         
         # Ensure errors directory exists
         errors_dir.mkdir(exist_ok=True)
         
         # Find all files matching the job ID pattern in both directories
-        pattern = f"*.{id}.*"
         matching_files = []
         subfolders_to_move = []
         
         # Check queued directory for flat files
         if queued_dir.exists():
-            queued_files = list(queued_dir.glob(pattern))
-            matching_files.extend([(f, 'queued') for f in queued_files])
+            matching_files.extend([(f, 'queued') for f in _files_with_id(queued_dir, id)])
             
             # Check queued directory for subfolders containing the job ID
-            for subfolder in queued_dir.iterdir():
-                if subfolder.is_dir():
-                    subfolder_files = list(subfolder.glob(f"*.{id}.*"))
-                    if subfolder_files:
-                        subfolders_to_move.append((subfolder, 'queued'))
+            subfolders_to_move.extend([(subfolder, 'queued') for subfolder in _subdirs_with_id(queued_dir, id)])
             
         # Check generated directory for flat files
         if generated_dir.exists():
-            generated_files = list(generated_dir.glob(pattern))
-            matching_files.extend([(f, 'generated') for f in generated_files])
+            matching_files.extend([(f, 'generated') for f in _files_with_id(generated_dir, id)])
             
             # Check generated directory for subfolders containing the job ID
-            for subfolder in generated_dir.iterdir():
-                if subfolder.is_dir():
-                    subfolder_files = list(subfolder.glob(f"*.{id}.*"))
-                    if subfolder_files:
-                        subfolders_to_move.append((subfolder, 'generated'))
+            subfolders_to_move.extend([(subfolder, 'generated') for subfolder in _subdirs_with_id(generated_dir, id)])
         
         if not matching_files and not subfolders_to_move:
             logger.warning(f"No files or subfolders found matching job ID {id} in queued or generated directories")
@@ -968,14 +1198,9 @@ def move_queued_to_errored(id:str) -> bool:
             try:
                 destination = errors_dir / file_path.name
                 
-                # If destination exists, remove it first
-                if destination.exists():
-                    logger.debug(f"Removing existing error file: {destination}")
-                    destination.unlink()
-                
-                # Move the file
-                file_path.rename(destination)
-                logger.debug(f"Moved from {source_type}: {file_path.name} -> {destination}")
+                # Move the file, atomically replacing any existing file at the destination
+                os.replace(file_path, destination)
+                logger.debug("Moved from %s: %s -> %s", source_type, file_path.name, destination)
                 moved_count += 1
                 
             except Exception as e:
@@ -988,14 +1213,8 @@ def move_queued_to_errored(id:str) -> bool:
             try:
                 destination_folder = errors_dir / subfolder.name
                 
-                # If destination exists, remove it first
-                if destination_folder.exists():
-                    logger.debug(f"Removing existing error folder: {destination_folder}")
-                    import shutil
-                    shutil.rmtree(destination_folder)
-                
-                # Move the entire subfolder
-                subfolder.rename(destination_folder)
+                # Move the entire subfolder, replacing any existing one
+                _replace_dir(subfolder, destination_folder)
                 logger.debug(f"Moved subfolder from {source_type}: {subfolder.name} -> {destination_folder.name}")
                 subfolders_moved += 1
                 
@@ -1032,18 +1251,16 @@ def move_queued_to_generated_with_validation(id: str) -> bool:
     
     try:
         # Get the jobs directory
-        jobs_dir = Path(__file__).parent / 'jobs'
-        queued_dir = jobs_dir / '1_queued'
-        generated_dir = jobs_dir / '2_generated'
+        queued_dir = QUEUED_DIR
+        generated_dir = GENERATED_DIR
         
         # Ensure directories exist
         if not queued_dir.exists():
             logger.error(f"Queued directory does not exist: {queued_dir}")
             return False
-            
-        generated_dir.mkdir(exist_ok=True)
         
-        # First, move the current job to generated (same logic as move_queued_to_generated)
+        # First, move the current job to generated (same logic as move_queued_to_generated,
+        # which also creates the generated directory)
         move_success = move_queued_to_generated(id)
         if not move_success:
             logger.error(f"Failed to move job {id} to generated directory")
@@ -1056,28 +1273,29 @@ def move_queued_to_generated_with_validation(id: str) -> bool:
         
         incomplete_jobs = []
         
-        # Check all subfolders in generated directory
-        for subfolder in generated_dir.iterdir():
-            if not subfolder.is_dir():
-                continue
+        # Check all subfolders in generated directory, in one scandir pass that only
+        # builds a Path for the incomplete ones
+        with os.scandir(generated_dir) as subfolders:
+            for subfolder in subfolders:
+                if not subfolder.is_dir():
+                    continue
                 
-            ai_content_dir = subfolder / 'ai_content'
-            
-            # Skip if no ai_content directory exists
-            if not ai_content_dir.exists():
-                logger.debug(f"Subfolder {subfolder.name} has no ai_content directory, skipping validation")
-                continue
-            
-            # Count YAML files in ai_content directory
-            yaml_files = list(ai_content_dir.glob('*.yaml'))
-            yaml_count = len(yaml_files)
-            
-            logger.debug(f"Subfolder {subfolder.name} has {yaml_count} ai_content files: {[f.stem for f in yaml_files]}")
-            
-            # If less than 7 files, mark for return to queued
-            if yaml_count < 7:
-                incomplete_jobs.append(subfolder)
-                logger.warning(f"Found incomplete job {subfolder.name} with only {yaml_count}/7 ai_content files")
+                # Count YAML files in ai_content directory, skipping if no ai_content directory exists
+                try:
+                    with os.scandir(os.path.join(subfolder.path, 'ai_content')) as it:
+                        yaml_names = [entry.name for entry in it if entry.name.endswith('.yaml')]
+                except FileNotFoundError:
+                    logger.debug("Subfolder %s has no ai_content directory, skipping validation", subfolder.name)
+                    continue
+                yaml_count = len(yaml_names)
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Subfolder {subfolder.name} has {yaml_count} ai_content files: {[name[:-5] for name in yaml_names]}")
+                
+                # If less than 7 files, mark for return to queued
+                if yaml_count < 7:
+                    incomplete_jobs.append(Path(subfolder.path))
+                    logger.warning(f"Found incomplete job {subfolder.name} with only {yaml_count}/7 ai_content files")
         
         # Move incomplete jobs back to queued directory
         moved_back_count = 0
@@ -1086,14 +1304,8 @@ def move_queued_to_generated_with_validation(id: str) -> bool:
                 # Determine destination path in queued directory
                 destination = queued_dir / incomplete_job_dir.name
                 
-                # If destination already exists, remove it first
-                if destination.exists():
-                    logger.debug(f"Removing existing queued folder: {destination}")
-                    import shutil
-                    shutil.rmtree(destination)
-                
-                # Move the incomplete job back to queued
-                incomplete_job_dir.rename(destination)
+                # Move the incomplete job back to queued, replacing any existing folder
+                _replace_dir(incomplete_job_dir, destination)
                 logger.info(f"Moved incomplete job back to queued: {incomplete_job_dir.name}")
                 moved_back_count += 1
                 
@@ -1123,9 +1335,8 @@ def move_queued_to_generated(id:str) -> bool:
     
     try:
         # Get the jobs directory
-        jobs_dir = Path(__file__).parent / 'jobs'
-        queued_dir = jobs_dir / '1_queued'
-        generated_dir = jobs_dir / '2_generated'
+        queued_dir = QUEUED_DIR
+        generated_dir = GENERATED_DIR
         
         # Ensure directories exist
         if not queued_dir.exists():
@@ -1135,8 +1346,7 @@ def move_queued_to_generated(id:str) -> bool:
         generated_dir.mkdir(exist_ok=True)
         
         # First check for flat files (legacy format)
-        pattern = f"*.{id}.*"
-        flat_files = list(queued_dir.glob(pattern))
+        flat_files = _files_with_id(queued_dir, id)
         
         if flat_files:
             logger.info(f"Found {len(flat_files)} flat files to move for job ID {id}")
@@ -1147,14 +1357,9 @@ def move_queued_to_generated(id:str) -> bool:
                 try:
                     destination = generated_dir / file_path.name
                     
-                    # If destination exists, remove it first
-                    if destination.exists():
-                        logger.debug(f"Removing existing file: {destination}")
-                        destination.unlink()
-                    
-                    # Move the file
-                    file_path.rename(destination)
-                    logger.debug(f"Moved: {file_path.name} -> {destination}")
+                    # Move the file, atomically replacing any existing file at the destination
+                    os.replace(file_path, destination)
+                    logger.debug("Moved: %s -> %s", file_path.name, destination)
                     moved_count += 1
                     
                 except Exception as e:
@@ -1167,33 +1372,21 @@ def move_queued_to_generated(id:str) -> bool:
         
         # Now check for subfolder structure (new format)
         subfolders_moved = 0
-        for subfolder in queued_dir.iterdir():
-            if not subfolder.is_dir():
-                continue
+        for subfolder in _subdirs_with_id(queued_dir, id):
+            logger.info(f"Found subfolder with job ID {id}: {subfolder.name}")
+            
+            try:
+                # Move the entire subfolder to generated directory
+                destination_folder = generated_dir / subfolder.name
                 
-            # Check if this subfolder contains files with the target job ID
-            matching_files = list(subfolder.glob(f"*.{id}.*"))
-            if matching_files:
-                logger.info(f"Found subfolder with job ID {id}: {subfolder.name}")
+                # Move the entire subfolder, replacing any existing one
+                _replace_dir(subfolder, destination_folder)
+                logger.info(f"Moved subfolder: {subfolder.name} -> {destination_folder.name}")
+                subfolders_moved += 1
                 
-                try:
-                    # Move the entire subfolder to generated directory
-                    destination_folder = generated_dir / subfolder.name
-                    
-                    # If destination exists, remove it first
-                    if destination_folder.exists():
-                        logger.debug(f"Removing existing folder: {destination_folder}")
-                        import shutil
-                        shutil.rmtree(destination_folder)
-                    
-                    # Move the entire subfolder
-                    subfolder.rename(destination_folder)
-                    logger.info(f"Moved subfolder: {subfolder.name} -> {destination_folder.name}")
-                    subfolders_moved += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error moving subfolder {subfolder}: {str(e)}")
-                    continue
+            except Exception as e:
+                logger.error(f"Error moving subfolder {subfolder}: {str(e)}")
+                continue
         
         if subfolders_moved > 0:
             logger.info(f"Successfully moved {subfolders_moved} subfolders for job ID {id}")
@@ -1210,7 +1403,7 @@ def move_queued_to_generated(id:str) -> bool:
 
 
 
-def print_pdf(job_id: str = None, output_dir: str = None):
+def print_pdf(job_id: str = None, output_dir: str = None, html_contents: dict[str, str] = None):
     """
     Convert HTML resume and cover letter files to PDF format.
     
@@ -1219,14 +1412,63 @@ def print_pdf(job_id: str = None, output_dir: str = None):
     Args:
         job_id (str, optional): Specific job ID to convert. If None, converts all jobs in 2_generated.
         output_dir (str, optional): Output directory for PDFs. If None, saves PDFs alongside HTML files.
+        html_contents (dict, optional): HTML already in memory, keyed by file name, so those files aren't re-read.
     
     Returns:
         dict: Summary of conversion results
     """
     from src.utils.pdf_mgr import print_pdf as pdf_print_pdf
-    return pdf_print_pdf(job_id, output_dir)
+    return pdf_print_pdf(job_id, output_dir, html_contents, jobs_dir=GENERATED_DIR)
+
+
+
+def _files_by_id(path: Path) -> dict[str, list[os.DirEntry]]:
+    """
+    Returns the files directly under path grouped by job ID, the second dotted part
+    of names like `timestamp.id.company.title.ext`, from a single os.scandir pass.
+    The directory entries are kept as-is, so no Path is built for any file.
+    """
+    files_by_id = {}
+    with os.scandir(path) as it:
+        for entry in it:
+            filename_parts = entry.name.split('.', 2)
+            if len(filename_parts) == 3 and entry.is_file():
+                files_by_id.setdefault(filename_parts[1], []).append(entry)
+    return files_by_id
+
+
+# Top-level keys bundle_to_directory needs from a job YAML file
+_HEADER_KEY_RE = re.compile(r'^(company|title):(?:\s|$)')
 
 
+def _read_yaml_header(path: Path) -> dict:
+    """
+    Returns the top-level `company` and `title` of a job YAML file without parsing
+    its (usually much larger) description. Each matching key line, together with any
+    indented lines the dumper wrapped its value onto, is parsed on its own, and reading
+    stops once both keys are found. Falls back to a full parse if either is missing.
+    """
+    header = {}
+    fragment = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if fragment and line[:1] in (' ', '\t'):
+                fragment.append(line)
+                continue
+            if fragment:
+                header.update(yaml.load(''.join(fragment), Loader=_Loader))
+                fragment = []
+                if len(header) == 2:
+                    return header
+            if _HEADER_KEY_RE.match(line):
+                fragment.append(line)
+    if fragment:
+        header.update(yaml.load(''.join(fragment), Loader=_Loader))
+    if len(header) == 2:
+        return header
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_Loader)
+
 
 def bundle_to_directory(ids:str|list) -> Path:
     """
@@ -1238,30 +1480,33 @@ def bundle_to_directory(ids:str|list) -> Path:
     """
     if not isinstance(ids, list): ids = [str(ids)]
     
+    # Get the generated directory
+    generated_dir = GENERATED_DIR
+    files_by_id = None
+
     try:
         for id in ids:
             logger.info(f"Bundling files for job ID {id} into directory")
 
-            # Get the generated directory
-            jobs_dir = Path(__file__).parent / 'jobs'
-            generated_dir = jobs_dir / '2_generated'
-            
-            if not generated_dir.exists():
-                logger.error(f"Generated directory does not exist: {generated_dir.name}")
-                raise ValueError(f"Generated directory does not exist: {generated_dir.name}")
+            # Scan the generated directory once, bucketing its files by job ID for every id in the list
+            if files_by_id is None:
+                try:
+                    files_by_id = _files_by_id(generated_dir)
+                except FileNotFoundError:
+                    logger.error(f"Generated directory does not exist: {generated_dir.name}")
+                    raise ValueError(f"Generated directory does not exist: {generated_dir.name}") from None
             
-            # Find all files matching the job ID pattern
-            pattern = f"*.{id}.*"
-            matching_files = list(generated_dir.glob(pattern))
+            # Find all files matching the job ID
+            matching_files = files_by_id.get(str(id), [])
             
             if not matching_files:
-                logger.warning(f"No files found matching pattern {pattern} in {generated_dir.name}")
+                logger.warning(f"No files found matching job ID {id} in {generated_dir.name}")
                 continue
             
             # Find the job YAML file to extract company and title
             job_yaml_file = None
             for file_path in matching_files:
-                if file_path.suffix == '.yaml':
+                if file_path.name.endswith('.yaml'):
                     job_yaml_file = file_path
                     break
             
@@ -1271,10 +1516,9 @@ def bundle_to_directory(ids:str|list) -> Path:
             
             # Load the job data to get company and title
             try:
-                with open(job_yaml_file, 'r', encoding='utf-8') as f:
-                    job_data = yaml.safe_load(f)
+                job_data = _read_yaml_header(job_yaml_file)
             except Exception as e:
-                logger.error(f"Error loading job YAML file {job_yaml_file}: {str(e)}")
+                logger.error(f"Error loading job YAML file {job_yaml_file.path}: {str(e)}")
                 continue
             
             # Extract company and title, sanitize for directory name
@@ -1285,15 +1529,15 @@ def bundle_to_directory(ids:str|list) -> Path:
             title_clean = sanitize_filename(title)
             
             # Extract timestamp from the first file (they should all have the same timestamp)
-            filename_parts = matching_files[0].stem.split('.')
-            timestamp = filename_parts[0] if len(filename_parts) > 0 else datetime.now().strftime('%Y%m%d%H%M%S')
+            filename_parts = matching_files[0].name.split('.', 1)
+            timestamp = filename_parts[0] if len(filename_parts) > 0 else time.strftime('%Y%m%d%H%M%S')
             
             # Create directory name: {company}.{title}.{id}.{date}
             directory_name = f"{company_clean}.{title_clean}.{id}.{timestamp}"
             bundle_dir = generated_dir / directory_name
             
             # Create the directory
-            bundle_dir.mkdir(exist_ok=True)
+            os.makedirs(bundle_dir, exist_ok=True)
             logger.info(f"Created bundle directory: {bundle_dir}")
             
             # Move all matching files to the new directory
@@ -1302,26 +1546,22 @@ def bundle_to_directory(ids:str|list) -> Path:
                 try:
                     destination = bundle_dir / file_path.name
                     
-                    # If destination exists, remove it first
-                    if destination.exists():
-                        logger.debug(f"Removing existing file: {destination}")
-                        destination.unlink()
-                    
-                    # Move the file
-                    file_path.rename(destination)
-                    logger.debug(f"Moved: {file_path.name} -> {destination}")
+                    # Move the file, atomically replacing any existing file at the destination
+                    os.replace(file_path, destination)
+                    logger.debug("Moved: %s -> %s", file_path.name, destination)
                     moved_count += 1
                     
                 except Exception as e:
-                    logger.error(f"Error moving file {file_path}: {str(e)}")
+                    logger.error(f"Error moving file {file_path.path}: {str(e)}")
                     continue
             
             if moved_count > 0:
                 logger.info(f"Successfully bundled {moved_count} files for job ID {id} into {bundle_dir}")
             else:
                 logger.warning(f"Failed to move ANY files for job ID {id}")
-                # Clean up empty directory
-                if bundle_dir.exists() and not any(bundle_dir.iterdir()): bundle_dir.rmdir()
+                # Clean up empty directory (created above, so it exists)
+                with os.scandir(bundle_dir) as it:
+                    if next(it, None) is None: bundle_dir.rmdir()
             
     except Exception as e:
         logger.error(f"Error in bundle_to_directory for job ID {id}: {str(e)}", exc_info=True)
@@ -1329,6 +1569,20 @@ def bundle_to_directory(ids:str|list) -> Path:
 
 
 
+def _write_text(path: str, text: str):
+    """
+    Writes text to path as UTF-8 straight through an os.open file descriptor. The outputs
+    are complete strings written once, so the buffered text-file layers add nothing.
+    """
+    data = memoryview(text.encode('utf-8'))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def generate(force:bool=False, id:str=None, additional_prompt:str=None):
     """
     Main function to demonstrate the functionality of the jobs_2_generate module.
@@ -1341,8 +1595,10 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
     logger.info("Starting resume generation process")
     
     # Create progress file for web UI tracking
-    progress_file = Path(__file__).parent / 'jobs' / '.step2_progress.json'
+    progress_file = JOBS_DIR / '.step2_progress.json'
     
+    progress_lock = threading.Lock()
+
     def update_progress(status, message, current_job=0, total_jobs=0, current_job_name='', error=None):
         """Update progress file for web UI"""
         try:
@@ -1358,7 +1614,7 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
                 'error': error,
                 'timestamp': datetime.now().isoformat()
             }
-            with open(progress_file, 'w') as f:
+            with progress_lock, open(progress_file, 'w') as f:
                 json.dump(progress_data, f)
         except Exception as e:
             logger.warning(f"Could not update progress file: {e}")
@@ -1409,13 +1665,12 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
         return
     
     # Create output directory
-    jobs_dir = Path(__file__).parent / 'jobs' / '2_generated'
+    jobs_dir = GENERATED_DIR
     jobs_dir.mkdir(exist_ok=True)
     logger.info(f"Output directory: {jobs_dir}")
     
-    # Get resume filename for output naming
-    resume_filename = resume.get('name', '').replace(' ','_')
-    if not resume_filename: 
+    # The resume must carry a name (output files are named per company, so it's only checked here)
+    if not resume.get('name'): 
         logger.error("Resume file missing 'name' key")
         error_msg = "Resume file missing 'name' key"
         update_progress('error', error_msg, error=error_msg)
@@ -1427,9 +1682,23 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
     failed_jobs = 0
     
     update_progress('running', f'Starting to process {total_jobs} jobs...', 0, total_jobs)
+
+    # every cover letter in this run carries the same date, formatted once
+    today = datetime.now().strftime(COVERLETTER_DATE_FORMAT)
     
-    # Process each job
-    for i, job in enumerate(jobs):
+    # Modular generation moves job folders between 1_queued and 2_generated while it runs, so its
+    # jobs go one at a time.  Legacy jobs overlap their LLM calls, and take file_lock for file work
+    modular = MODULAR_AVAILABLE and get_config().is_modular_enabled()
+    file_lock = threading.Lock()
+
+    # Look up every queued job file (or just the requested one) once, before any job moves files around
+    try:
+        queued_yaml_by_id = _queued_yaml_by_id(QUEUED_DIR, id)
+    except FileNotFoundError:
+        queued_yaml_by_id = {}
+
+    def process_job(job, i):
+        """Generates, saves and finalizes one job; returns True on success, False on error, None if skipped."""
         job_title = job.get('title', 'Unknown')
         job_company = job.get('company', 'Unknown')
         
@@ -1438,7 +1707,7 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
         if not job_id or job_id == 'Unknown' or job_id.strip() == '':
             # Generate a proper job ID based on company and title
             import hashlib
-            job_content = f"{job_company}_{job_title}_{i}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            job_content = f"{job_company}_{job_title}_{i}_{time.strftime('%Y%m%d%H%M%S')}"
             job_id = str(abs(hash(job_content)) % 10000000000)  # 10-digit ID
             logger.warning(f"Generated new job ID {job_id} for job with missing/invalid ID: {job_title} at {job_company}")
             # Update the job data with the new ID
@@ -1449,38 +1718,19 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
         
         # Update progress for current job
         update_progress('running', f'Processing {current_job_name}...', i, total_jobs, current_job_name)
+
+        # Output files are handed to the writer thread, so the next LLM call starts right away;
+        # each write maps to the (kind, path) logged once the file is on disk
+        pending_writes = {}
         
         try:
             # Find the original queued file to extract timestamp and get job YAML path
-            queued_dir = Path(__file__).parent / 'jobs' / '1_queued'
-            timestamp = None
-            job_yaml_path = None
-            
-            # Look for the matching job file by ID - check both flat files and subfolders
-            # First check flat files (legacy format)
-            for queued_file in queued_dir.glob('*.yaml'):
-                filename_parts = queued_file.stem.split('.')
-                if len(filename_parts) >= 2 and filename_parts[1] == job_id:
-                    timestamp = filename_parts[0]
-                    job_yaml_path = queued_file
-                    break
-            
-            # If not found in flat files, check subfolders (new format)
-            if not timestamp:
-                for subfolder in queued_dir.iterdir():
-                    if subfolder.is_dir():
-                        for queued_file in subfolder.glob('*.yaml'):
-                            filename_parts = queued_file.stem.split('.')
-                            if len(filename_parts) >= 2 and filename_parts[1] == job_id:
-                                timestamp = filename_parts[0]
-                                job_yaml_path = queued_file
-                                break
-                        if timestamp:
-                            break
+            job_yaml_path = queued_yaml_by_id.get(job_id)
+            timestamp = job_yaml_path.name.split('.', 1)[0] if job_yaml_path else None
             
             if not timestamp:
                 logger.warning(f"Could not find timestamp for job {job_id}, using current time")
-                timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+                timestamp = time.strftime('%Y%m%d%H%M%S')
             
             # IMPROVED: Create job directory immediately instead of loose files
             # Sanitize company and title for directory name
@@ -1490,41 +1740,58 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
             # Create job directory: {company}.{title}.{id}.{timestamp}
             job_directory_name = f"{company_clean}.{title_clean}.{job_id}.{timestamp}"
             job_output_dir = jobs_dir / job_directory_name
-            job_output_dir.mkdir(exist_ok=True)
-            
-            # Create ai_content subdirectory for caching
-            ai_content_dir = job_output_dir / 'ai_content'
-            ai_content_dir.mkdir(exist_ok=True)
-            
-            logger.info(f"Created job directory: {job_directory_name}")
+            # output files only go to open() and log lines, so they're joined as plain strings
+            job_output_str = str(job_output_dir)
+            # Output files are named {timestamp}.{id}.{company}.<kind>.html
+            output_prefix = f"{timestamp}.{job_id}.{company_clean}."
+
+            def create_job_directory():
+                # Create the job directory with its ai_content subdirectory for caching
+                os.makedirs(os.path.join(job_output_str, 'ai_content'), exist_ok=True)
+                
+                logger.info(f"Created job directory: {job_directory_name}")
+
+            # Modular generation caches into the job directory as it runs.  Legacy jobs add ai_content
+            # only when finalized: validation skips folders without it, so it won't bounce a job
+            # another thread is still writing back to 1_queued
+            if modular:
+                create_job_directory()
             
+            # structure the job once, for the resume, cover letter and summary prompts
+            job_str = structure_job(job)
+
+            # The summary only needs the job, so its LLM call runs alongside the resume and cover letter
+            summary_future = summary_executor.submit(llm_generate_job_summary, job, job_str=job_str)
+
             # ------------------------------------------------------------
             # Generate custom resume
             logger.info("Generating custom resume...")
             update_progress('running', f'Generating resume for {current_job_name}...', i, total_jobs, current_job_name)
             force_flush_logs()
-            custom_resume = llm_generate_custom_resume(resume, job, additional_prompt)
+            # In modular mode, the cover letter is rendered from the same generated sections as the resume
+            custom_resume, rendered_coverletter = llm_generate_custom_resume_with_coverletter(resume, job, additional_prompt, job_str=job_str)
             logger.info(f"Generated resume length: {len(custom_resume)} characters")
             force_flush_logs()
             
             # Save resume in job directory
-            resume_filename_output = f"{timestamp}.{job_id}.{company_clean}.resume.html"
-            # Add version info to HTML content
-            if len(custom_resume) > 0:
-                # Add version to footer
-                custom_resume = custom_resume.replace(
-                    '</body>',
-                    f'<div class="version-footer"><a href="https://github.com/Stephen-Hilton/resumai" target="_blank" style="color: inherit; text-decoration: none;">ResumeAI v{VERSION}</a></div></body>'
-                )
-                
-                resume_output_path = job_output_dir / resume_filename_output
-                with open(resume_output_path, 'w', encoding='utf-8') as f:
-                    f.write(custom_resume)
-                logger.info(f"Resume saved: {resume_output_path}")
-            else:
-                logger.error("Generated resume is empty, not saving")
-                move_queued_to_errored(job_id)
-                continue
+            resume_filename_output = output_prefix + "resume.html"
+            with file_lock:
+                # Add version info to HTML content
+                if len(custom_resume) > 0:
+                    # Add version to footer
+                    custom_resume = custom_resume.replace(
+                        '</body>',
+                        f'<div class="version-footer"><a href="https://github.com/Stephen-Hilton/resumai" target="_blank" style="color: inherit; text-decoration: none;">ResumeAI v{_version()}</a></div></body>'
+                    )
+                    
+                    os.makedirs(job_output_str, exist_ok=True)
+                    resume_output_path = os.path.join(job_output_str, resume_filename_output)
+                    pending_writes[writer.submit(_write_text, resume_output_path, custom_resume)] = ("Resume", resume_output_path)
+                    logger.info(f"Resume queued for write: {resume_output_path}")
+                else:
+                    logger.error("Generated resume is empty, not saving")
+                    move_queued_to_errored(job_id)
+                    return None
 
 
             # ------------------------------------------------------------
@@ -1532,83 +1799,106 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
             logger.info("Generating custom cover letter...")
             update_progress('running', f'Generating cover letter for {current_job_name}...', i, total_jobs, current_job_name)
             force_flush_logs()
-            custom_coverletter = llm_generate_custom_coverletter(resume, job, custom_resume, additional_prompt)
+            if rendered_coverletter:
+                logger.info("Using the cover letter rendered with the modular resume")
+                custom_coverletter = rendered_coverletter
+            else:
+                custom_coverletter = llm_generate_custom_coverletter(resume, job, custom_resume, additional_prompt, job_str=job_str, today=today)
             logger.info(f"Generated cover letter length: {len(custom_coverletter)} characters")
             force_flush_logs()
 
             # Save cover letter in job directory
-            coverletter_filename_output = f"{timestamp}.{job_id}.{company_clean}.coverletter.html"
-            # Add version info to cover letter HTML content  
-            if len(custom_coverletter) > 0:
-                # Add version to footer
-                custom_coverletter = custom_coverletter.replace(
-                    '</body>',
-                    f'<div class="version-footer"><a href="https://github.com/Stephen-Hilton/resumai" target="_blank" style="color: inherit; text-decoration: none;">ResumeAI v{VERSION}</a></div></body>'
-                )
-                
-                coverletter_output_path = job_output_dir / coverletter_filename_output
-                with open(coverletter_output_path, 'w', encoding='utf-8') as f:
-                    f.write(custom_coverletter)
-                logger.info(f"Cover letter saved: {coverletter_output_path}")
-            else:
-                logger.error("Generated cover letter is empty, not saving")
-                move_queued_to_errored(job_id)
-                continue
+            coverletter_filename_output = output_prefix + "coverletter.html"
+            with file_lock:
+                # Add version info to cover letter HTML content  
+                if len(custom_coverletter) > 0:
+                    # Add version to footer
+                    custom_coverletter = custom_coverletter.replace(
+                        '</body>',
+                        f'<div class="version-footer"><a href="https://github.com/Stephen-Hilton/resumai" target="_blank" style="color: inherit; text-decoration: none;">ResumeAI v{_version()}</a></div></body>'
+                    )
+                    
+                    coverletter_output_path = os.path.join(job_output_str, coverletter_filename_output)
+                    pending_writes[writer.submit(_write_text, coverletter_output_path, custom_coverletter)] = ("Cover letter", coverletter_output_path)
+                    logger.info(f"Cover letter queued for write: {coverletter_output_path}")
+                else:
+                    logger.error("Generated cover letter is empty, not saving")
+                    wait(pending_writes)
+                    move_queued_to_errored(job_id)
+                    return None
 
 
             # ------------------------------------------------------------
             # Generate job summary
-            logger.info("Generating job summary...")
+            logger.info("Waiting on job summary...")
             update_progress('running', f'Generating summary for {current_job_name}...', i, total_jobs, current_job_name)
             force_flush_logs()
-            custom_summary = llm_generate_job_summary(job)
+            custom_summary = summary_future.result()
             logger.info(f"Generated summary length: {len(custom_summary)} characters")
             force_flush_logs()
 
             # Save summary in job directory
-            summary_filename_output = f"{timestamp}.{job_id}.{company_clean}.!SUMMARY.html"
-            if len(custom_summary) > 0:
-                summary_output_path = job_output_dir / summary_filename_output
-                with open(summary_output_path, 'w', encoding='utf-8') as f:
-                    f.write(custom_summary)
-                logger.info(f"Summary saved: {summary_output_path}")
-            else:
-                logger.error("Generated summary is empty, not saving")
-                move_queued_to_errored(job_id)
-                continue
-
-            # Copy the original job YAML file to the job directory
-            if job_yaml_path and job_yaml_path.exists():
-                job_yaml_destination = job_output_dir / job_yaml_path.name
-                import shutil
-                shutil.copy2(job_yaml_path, job_yaml_destination)
-                logger.info(f"Copied job YAML to: {job_yaml_destination}")
-
-            # Note: Job is already moved to generated after AI content creation in modular system
-            # For legacy generation, we need to move it here
-            if not MODULAR_AVAILABLE or not get_config().is_modular_enabled():
-                logger.info("Using legacy generation - moving job to generated directory")
-                update_progress('running', f'Finalizing {current_job_name}...', i, total_jobs, current_job_name)
-                move_queued_to_generated_with_validation(job_id)
-            else:
-                logger.info("Modular generation used - job already moved to generated directory")
-
-            # ------------------------------------------------------------
-            # Generate PDF files for resume and cover letter
-            print_pdf(job_id)
+            summary_filename_output = output_prefix + "!SUMMARY.html"
+            with file_lock:
+                if len(custom_summary) > 0:
+                    summary_output_path = os.path.join(job_output_str, summary_filename_output)
+                    pending_writes[writer.submit(_write_text, summary_output_path, custom_summary)] = ("Summary", summary_output_path)
+                    logger.info(f"Summary queued for write: {summary_output_path}")
+                else:
+                    logger.error("Generated summary is empty, not saving")
+                    wait(pending_writes)
+                    move_queued_to_errored(job_id)
+                    return None
+
+                # Finish this job's writes before its files are copied, moved and printed
+                for write, (kind, output_path) in pending_writes.items():
+                    write.result()
+                    logger.info(f"{kind} saved: {output_path}")
+
+                # Copy the original job YAML file to the job directory
+                if job_yaml_path and job_yaml_path.exists():
+                    job_yaml_destination = job_output_dir / job_yaml_path.name
+                    shutil.copy2(job_yaml_path, job_yaml_destination)
+                    logger.info(f"Copied job YAML to: {job_yaml_destination}")
+
+                # Note: Job is already moved to generated after AI content creation in modular system
+                # For legacy generation, we need to move it here
+                if not modular:
+                    create_job_directory()
+                    logger.info("Using legacy generation - moving job to generated directory")
+                    update_progress('running', f'Finalizing {current_job_name}...', i, total_jobs, current_job_name)
+                    move_queued_to_generated_with_validation(job_id)
+                else:
+                    logger.info("Modular generation used - job already moved to generated directory")
+
+                # ------------------------------------------------------------
+                # Generate PDF files for resume and cover letter
+                print_pdf(job_id, html_contents={resume_filename_output: custom_resume,
+                                                 coverletter_filename_output: custom_coverletter})
 
             # No need to bundle since files are already in proper directory structure
 
-            successful_jobs += 1
             logger.info(f"Successfully processed job {job_id} in directory {job_directory_name}")
-            
-
+            return True
 
         except Exception as e:
-            failed_jobs += 1
             logger.error(f"Error processing job {job_id}: {str(e)}", exc_info=True)
-            move_queued_to_errored(job_id)
-            continue
+            wait(pending_writes)
+            with file_lock:
+                move_queued_to_errored(job_id)
+            return False
+
+    # Process the jobs, tallying each one as it completes
+    with ThreadPoolExecutor(max_workers=1 if modular else LLM_WORKERS) as executor, \
+         ThreadPoolExecutor(max_workers=LLM_WORKERS) as summary_executor, \
+         ThreadPoolExecutor(max_workers=1) as writer:
+        futures = [executor.submit(process_job, job, i) for i, job in enumerate(jobs)]
+        for future in as_completed(futures):
+            processed = future.result()
+            if processed is True:
+                successful_jobs += 1
+            elif processed is False:
+                failed_jobs += 1
     
     # Final progress update
     final_message = f"Completed processing: {successful_jobs} successful, {failed_jobs} failed out of {total_jobs} total jobs"
@@ -1625,7 +1915,6 @@ def generate(force:bool=False, id:str=None, additional_prompt:str=None):
     
     # Clean up progress file after a delay
     try:
-        import threading
         def cleanup_progress():
             import time
             time.sleep(30)  # Keep progress visible for 30 seconds
@@ -44,6 +44,12 @@ VERSION = get_version()
 # Set up logger
 logger = logging_setup.get_logger(__name__)
 
+# Job listings re-read every job YAML on each page load; use LibYAML when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 app = Flask(__name__)
 app.secret_key = 'resumai_web_ui_secret_key_change_in_production'
 app.config['SERVER_NAME'] = None  # Allow any host
@@ -133,7 +139,7 @@ def get_job_folders():
                 job_yaml = yaml_files[0]  # Take the first YAML file
                 try:
                     with open(job_yaml, 'r', encoding='utf-8') as f:
-                        job_data = yaml.safe_load(f)
+                        job_data = yaml.load(f, Loader=_Loader)
                     
                     # Check for file existence
                     resume_html = list(item.glob('*.resume.html'))
@@ -262,7 +268,7 @@ def get_jobs_by_phase(phase='generated'):
         for yaml_file in phase_dir.glob('*.yaml'):
             try:
                 with open(yaml_file, 'r', encoding='utf-8') as f:
-                    job_data = yaml.safe_load(f)
+                    job_data = yaml.load(f, Loader=_Loader)
                 
                 folders.append({
                     'name': yaml_file.stem,
@@ -293,7 +299,7 @@ def get_jobs_by_phase(phase='generated'):
                     job_yaml = yaml_files[0]
                     try:
                         with open(job_yaml, 'r', encoding='utf-8') as f:
-                            job_data = yaml.safe_load(f)
+                            job_data = yaml.load(f, Loader=_Loader)
                         
                         folders.append({
                             'name': item.name,
@@ -325,7 +331,7 @@ def get_jobs_by_phase(phase='generated'):
                     job_yaml = yaml_files[0]
                     try:
                         with open(job_yaml, 'r', encoding='utf-8') as f:
-                            job_data = yaml.safe_load(f)
+                            job_data = yaml.load(f, Loader=_Loader)
                         
                         # Check for file existence
                         resume_html = list(item.glob('*.resume.html'))
@@ -358,7 +364,7 @@ def get_jobs_by_phase(phase='generated'):
         for yaml_file in phase_dir.glob('*.yaml'):
             try:
                 with open(yaml_file, 'r', encoding='utf-8') as f:
-                    job_data = yaml.safe_load(f)
+                    job_data = yaml.load(f, Loader=_Loader)
                 
                 folders.append({
                     'name': yaml_file.stem,
@@ -639,7 +645,7 @@ def add_extracted_job_to_queue():
     try:
         import yaml
         from datetime import datetime
-        from step1_queue import sanitize_job_data, get_all_ids
+        from step1_queue import sanitize_job_data, get_all_ids, append_id_index
         
         # Get JSON data from request
         request_data = request.get_json()
@@ -711,6 +717,9 @@ def add_extracted_job_to_queue():
         with open(yaml_file_path, 'w', encoding='utf-8') as f:
             yaml.safe_dump(yaml_data, f, default_flow_style=False, allow_unicode=True, indent=2)
         
+        # Record the ID so step1_queue's sidecar index won't queue this job again
+        append_id_index(JOBS_DIR, job_id)
+        
         logger.info(f"URL job entry created: {subfolder_name}")
         
         return jsonify({
@@ -783,7 +792,7 @@ def job_detail(folder_name, phase='generated'):
         
         try:
             with open(yaml_file, 'r', encoding='utf-8') as f:
-                job_data = yaml.safe_load(f)
+                job_data = yaml.load(f, Loader=_Loader)
         except Exception as e:
             flash(f'Error loading job data: {e}', 'error')
             return redirect(url_for('index', phase=phase))
@@ -832,7 +841,7 @@ def job_detail(folder_name, phase='generated'):
     
     try:
         with open(yaml_file, 'r', encoding='utf-8') as f:
-            job_data = yaml.safe_load(f)
+            job_data = yaml.load(f, Loader=_Loader)
     except Exception as e:
         flash(f'Error loading job data: {e}', 'error')
         return redirect(url_for('index', phase=phase))
@@ -916,7 +925,7 @@ def edit_job(folder_name, phase='generated'):
             yaml_content = request.form['yaml_content']
             
             # Validate YAML syntax
-            yaml.safe_load(yaml_content)
+            yaml.load(yaml_content, Loader=_Loader)
             
             # Save the file
             with open(yaml_file, 'w', encoding='utf-8') as f:
@@ -1046,7 +1055,7 @@ def open_link(folder_name):
     
     try:
         with open(yaml_files[0], 'r', encoding='utf-8') as f:
-            job_data = yaml.safe_load(f)
+            job_data = yaml.load(f, Loader=_Loader)
         
         link = job_data.get('link')
         if link:
@@ -1186,17 +1195,13 @@ def reset_to_queued(folder_name):
         
         # Move YAML file
         yaml_destination = queued_subfolder / original_yaml.name
-        if yaml_destination.exists():
-            yaml_destination.unlink()  # Remove existing file
-        original_yaml.rename(yaml_destination)
+        os.replace(original_yaml, yaml_destination)  # Replaces any existing file
         files_moved.append(original_yaml.name)
         
         # Move HTML file if it exists
         if original_html:
             html_destination = queued_subfolder / original_html.name
-            if html_destination.exists():
-                html_destination.unlink()  # Remove existing file
-            original_html.rename(html_destination)
+            os.replace(original_html, html_destination)  # Replaces any existing file
             files_moved.append(original_html.name)
         
         # Remove the entire job directory and all remaining files
@@ -1299,7 +1304,7 @@ def regenerate_job(folder_name):
         
         # Load job data to get the ID
         with open(job_yaml, 'r', encoding='utf-8') as f:
-            job_data = yaml.safe_load(f)
+            job_data = yaml.load(f, Loader=_Loader)
         
         job_id = job_data.get('id')
         if not job_id:
@@ -1374,7 +1379,7 @@ def regenerate_job(folder_name):
                     
                     import yaml
                     with open(yaml_files[0], 'r') as f:
-                        job_data = yaml.safe_load(f)
+                        job_data = yaml.load(f, Loader=_Loader)
                     
                     # Load resume data from the selected resume file
                     from step2_generate import load_resume_file
@@ -2331,7 +2336,7 @@ def regenerate_html_only(folder_name):
         
         # Load job data
         with open(yaml_file, 'r') as f:
-            job_data = yaml.safe_load(f)
+            job_data = yaml.load(f, Loader=_Loader)
         
         # Load resume data
         try:
@@ -2985,9 +2990,7 @@ def skip_job(folder_name):
             source_path.rename(dest_path)
         else:  # YAML file
             dest_path = skipped_dir / f"{folder_name}.yaml"
-            if dest_path.exists():
-                dest_path.unlink()
-            source_path.rename(dest_path)
+            os.replace(source_path, dest_path)
         
         logger.info(f"Skipped job: {folder_name} (moved from {source_path.parent.name})")
         return jsonify({'success': True, 'message': f'Job {folder_name} has been skipped'})
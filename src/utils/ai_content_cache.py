@@ -15,6 +15,11 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 class AIContentCache:
     """
     Manages saving and loading AI-generated content to/from job directories.
@@ -99,7 +104,7 @@ class AIContentCache:
                 return None
             
             with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = yaml.safe_load(f)
+                cache_data = yaml.load(f, Loader=_Loader)
             
             if not isinstance(cache_data, dict) or 'content' not in cache_data:
                 self.logger.error(f"Invalid cache data structure for section '{section_name}'")
@@ -316,7 +321,7 @@ class AIContentCache:
                 cache_file = self.cache_dir / f"{section_name}.yaml"
                 try:
                     with open(cache_file, 'r', encoding='utf-8') as f:
-                        cache_data = yaml.safe_load(f)
+                        cache_data = yaml.load(f, Loader=_Loader)
                     
                     cache_info['sections_detail'][section_name] = {
                         'generated_at': cache_data.get('generated_at'),
@@ -352,7 +357,7 @@ class AIContentCache:
             existing_metadata = {}
             if cache_file.exists():
                 with open(cache_file, 'r', encoding='utf-8') as f:
-                    existing_data = yaml.safe_load(f)
+                    existing_data = yaml.load(f, Loader=_Loader)
                     existing_metadata = existing_data.get('metadata', {})
             
             # Update metadata
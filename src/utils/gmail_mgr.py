@@ -12,6 +12,13 @@ from . import logging_setup
 # Set up logger for this module
 logger = logging_setup.get_logger(__name__)
 
+# Maximum number of messages requested per IMAP FETCH command
+FETCH_BATCH_SIZE = 100
+
+# FETCH items for the filtering pass: just the headers the Python-level filters read, plus
+# FLAGS, so full message bodies are only downloaded for messages that will be returned
+HEADER_FETCH_ITEMS = '(BODY.PEEK[HEADER.FIELDS (FROM SUBJECT DATE)] FLAGS)'
+
 def get_gmails(gmail_address:str,
                app_password:str, 
                unread_only:bool=True, 
@@ -79,6 +86,28 @@ def get_gmails(gmail_address:str,
                 html = msg.get_payload(decode=True).decode(msg.get_content_charset() or 'utf-8', errors='ignore')
         return text, html
 
+    def _fetch_batch(mail, nums, items='(BODY.PEEK[] FLAGS)'):
+        # Fetch several messages in a single IMAP FETCH round trip, rather than
+        # one round trip per message. Returns {num: (raw_bytes, is_read)}.
+        # Use BODY.PEEK to avoid marking messages as \Seen when fetching
+        # them. Include FLAGS so we can inspect read state.
+        status, msg_data = mail.fetch(b','.join(nums), items)
+        if status != 'OK':
+            return {}
+        fetched = {}
+        current = None
+        for part in msg_data:
+            if isinstance(part, tuple) and len(part) > 1:
+                # Each message starts with a (b'<num> (FLAGS ... BODY[] {size}', raw) tuple
+                head = part[0]
+                current = head.split(b' ', 1)[0]
+                fetched[current] = [part[1], b'FLAGS' in head and b'\\Seen' in head]
+            elif isinstance(part, bytes) and current in fetched:
+                # FLAGS may also trail the message literal, e.g. b' FLAGS (\\Seen))'
+                if b'FLAGS' in part and b'\\Seen' in part:
+                    fetched[current][1] = True
+        return fetched
+
     results = []
 
     # Connect to Gmail IMAP
@@ -116,94 +145,95 @@ def get_gmails(gmail_address:str,
         ids = list(reversed(ids))
 
         count = 0
-        for num in ids:
+        for start in range(0, len(ids), FETCH_BATCH_SIZE):
             if count >= max_results:
                 break
-            # Use BODY.PEEK[] to avoid marking messages as \Seen when fetching
-            # the full message. Include FLAGS so we can inspect read state.
-            status, msg_data = mail.fetch(num, '(BODY.PEEK[] FLAGS)')
-            if status != 'OK':
-                continue
-            # Extract the first tuple payload containing the raw message bytes.
-            raw = None
-            for part in msg_data:
-                if isinstance(part, tuple) and part[1]:
-                    raw = part[1]
+            batch = ids[start:start + FETCH_BATCH_SIZE]
+            headers = _fetch_batch(mail, batch, HEADER_FETCH_ITEMS)
+
+            # Filter on headers first, keeping no more matches than are still needed
+            matches = []
+            for num in batch:
+                if count + len(matches) >= max_results:
                     break
-            if raw is None:
-                # Nothing to parse
-                continue
-            msg = email.message_from_bytes(raw)
-
-            subject = _decode_mime_words(msg.get('Subject'))
-            frm = _decode_mime_words(msg.get('From'))
-            to = _decode_mime_words(msg.get('To'))
-            date_hdr = msg.get('Date')
-            try:
-                date_dt = parsedate_to_datetime(date_hdr) if date_hdr else None
-            except Exception:
-                date_dt = None
-
-            # apply python-level filters
-            if subject_filters:
-                if not any(s.lower() in (subject or '').lower() for s in subject_filters):
-                    # skip
-                    continue
-            if sender_filters:
-                if not any(s.lower() in (frm or '').lower() for s in sender_filters):
+                raw_headers, is_read = headers.get(num, (None, False))
+                if not raw_headers:
+                    # Nothing to parse
                     continue
-            if sent_since and date_dt:
-                # Normalize both datetimes to UTC for safe comparison whether
-                # they are timezone-aware or naive.
+                msg = email.message_from_bytes(raw_headers)
+
+                subject = _decode_mime_words(msg.get('Subject'))
+                frm = _decode_mime_words(msg.get('From'))
+                date_hdr = msg.get('Date')
                 try:
-                    if date_dt.tzinfo is None:
-                        date_cmp = date_dt.replace(tzinfo=timezone.utc)
-                    else:
-                        date_cmp = date_dt.astimezone(timezone.utc)
-                    if sent_since.tzinfo is None:
-                        sent_cmp = sent_since.replace(tzinfo=timezone.utc)
-                    else:
-                        sent_cmp = sent_since.astimezone(timezone.utc)
+                    date_dt = parsedate_to_datetime(date_hdr) if date_hdr else None
                 except Exception:
-                    date_cmp = date_dt
-                    sent_cmp = sent_since
-                if date_cmp < sent_cmp:
+                    date_dt = None
+
+                # apply python-level filters
+                if subject_filters:
+                    if not any(s.lower() in (subject or '').lower() for s in subject_filters):
+                        # skip
+                        continue
+                if sender_filters:
+                    if not any(s.lower() in (frm or '').lower() for s in sender_filters):
+                        continue
+                if sent_since and date_dt:
+                    # Normalize both datetimes to UTC for safe comparison whether
+                    # they are timezone-aware or naive.
+                    try:
+                        if date_dt.tzinfo is None:
+                            date_cmp = date_dt.replace(tzinfo=timezone.utc)
+                        else:
+                            date_cmp = date_dt.astimezone(timezone.utc)
+                        if sent_since.tzinfo is None:
+                            sent_cmp = sent_since.replace(tzinfo=timezone.utc)
+                        else:
+                            sent_cmp = sent_since.astimezone(timezone.utc)
+                    except Exception:
+                        date_cmp = date_dt
+                        sent_cmp = sent_since
+                    if date_cmp < sent_cmp:
+                        continue
+
+                matches.append((num, subject, frm, date_dt, is_read))
+
+            if not matches:
+                continue
+
+            # Download the full messages for the matches only, in one round trip
+            fetched = _fetch_batch(mail, [match[0] for match in matches])
+
+            for num, subject, frm, date_dt, is_read in matches:
+                raw, _ = fetched.get(num, (None, False))
+                if not raw:
+                    # Nothing to parse
                     continue
+                msg = email.message_from_bytes(raw)
 
-            body_text, body_html = _get_body(msg)
-
-            # find flags from fetch response
-            is_read = False
-            try:
-                for part in msg_data:
-                    if isinstance(part, tuple) and len(part) > 0:
-                        head = part[0]
-                        if isinstance(head, bytes) and b'FLAGS' in head:
-                            if b'\\Seen' in head:
-                                is_read = True
-            except Exception:
-                pass
-
-            entry = {
-                'id': num.decode() if isinstance(num, bytes) else str(num),
-                'subject': subject,
-                'from': frm,
-                'to': to,
-                'date': date_dt.astimezone(ZoneInfo("America/Los_Angeles")).isoformat() if date_dt else None,
-                'body_text': body_text,
-                'body_html': body_html,
-                'raw': raw,
-                'is_read': is_read,
-            }
-
-            results.append(entry)
-            count += 1
-
-            if mark_as_read:
-                try:
-                    mail.store(num, '+FLAGS', '\\Seen')
-                except Exception:
-                    pass
+                to = _decode_mime_words(msg.get('To'))
+                body_text, body_html = _get_body(msg)
+
+                entry = {
+                    'id': num.decode() if isinstance(num, bytes) else str(num),
+                    'subject': subject,
+                    'from': frm,
+                    'to': to,
+                    'date': date_dt.astimezone(ZoneInfo("America/Los_Angeles")).isoformat() if date_dt else None,
+                    'body_text': body_text,
+                    'body_html': body_html,
+                    'raw': raw,
+                    'is_read': is_read,
+                }
+
+                results.append(entry)
+                count += 1
+
+                if mark_as_read:
+                    try:
+                        mail.store(num, '+FLAGS', '\\Seen')
+                    except Exception:
+                        pass
         
         results.sort(key=lambda x: x.get('date') or '', reverse=True)
         return results
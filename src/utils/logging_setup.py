@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from pathlib import Path
 
@@ -8,6 +11,9 @@ def setup_logging():
     """
     Set up logging to both console and dated log files with auto-flush.
     Creates logs in src/logs/ directory with format: YYYY-MM-DD_resumai.log
+    Records are handed to a QueueListener thread that writes them out, so logging
+    calls only enqueue; force_flush_logs() waits for the queue to drain, and it is
+    drained at interpreter exit.
     
     Returns:
         logger: Logger instance for the calling module
@@ -42,16 +48,20 @@ def setup_logging():
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(logging.Formatter(log_format, date_format))
     
-    # Configure root logger
+    # Configure root logger, with the handlers running on the listener's thread
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    atexit.register(_stop_listener)
     
     # Set stdout to be unbuffered for immediate console output
     sys.stdout.reconfigure(line_buffering=True)
     
     # Mark that we've configured logging
     root_logger._resumai_configured = True
+    root_logger._resumai_listener = listener
     
     # Log startup message
     logger = logging.getLogger(__name__)
@@ -63,13 +73,29 @@ def setup_logging():
     return logger
 
 
+def _stop_listener():
+    """Stop the QueueListener at exit, writing out any records still queued"""
+    root_logger = logging.getLogger()
+    listener = getattr(root_logger, '_resumai_listener', None)
+    if listener is not None:
+        root_logger._resumai_listener = None
+        listener.stop()
+
+
 def force_flush_logs():
-    """Force flush all logging handlers and stdout to ensure immediate output"""
-    sys.stdout.flush()
-    sys.stderr.flush()
-    for handler in logging.getLogger().handlers:
+    """
+    Force flush all logging handlers and stdout to ensure immediate output.
+    Waits until the QueueListener has written every record queued so far.
+    """
+    root_logger = logging.getLogger()
+    listener = getattr(root_logger, '_resumai_listener', None)
+    if listener is not None:
+        listener.queue.join()
+    for handler in root_logger.handlers + list(listener.handlers if listener else ()):
         if hasattr(handler, 'flush'):
             handler.flush()
+    sys.stdout.flush()
+    sys.stderr.flush()
 
 
 def get_logger(name):
@@ -8,6 +8,8 @@ with fallback to legacy generation when needed.
 
 import asyncio
 import logging
+import os
+import re
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 from datetime import datetime
@@ -24,6 +26,18 @@ from .pdf_manager import PDFManager
 
 logger = logging.getLogger(__name__)
 
+# Filename sanitization patterns, compiled once for every saved job
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_FILENAME_SEPARATOR_RUNS = re.compile(r'[\s_]+')
+
+
+def _sanitize_filename(text: str) -> str:
+    """Replace characters that are unsafe in filenames and limit the result to 50 characters."""
+    sanitized = _UNSAFE_FILENAME_CHARS.sub('_', text)
+    sanitized = _FILENAME_SEPARATOR_RUNS.sub('_', sanitized)
+    return sanitized.strip('_')[:50]
+
+
 class ModularResumeGenerator:
     """
     Main orchestrator for the modular resume generation process.
@@ -193,7 +207,6 @@ class ModularResumeGenerator:
             if job_directory:
                 try:
                     from pathlib import Path
-                    import re
                     
                     job_dir_path = Path(job_directory)
                     
@@ -202,20 +215,15 @@ class ModularResumeGenerator:
                     company = job_data.get('company', 'Unknown_Company')
                     title = job_data.get('title', 'Unknown_Title')
                     
-                    # Sanitize for filename
-                    def sanitize_filename(text):
-                        sanitized = re.sub(r'[<>:"/\\|?*]', '_', text)
-                        sanitized = re.sub(r'[\s_]+', '_', sanitized)
-                        return sanitized.strip('_')[:50]
-                    
-                    company_clean = sanitize_filename(company)
+                    company_clean = _sanitize_filename(company)
                     
                     # Generate timestamp (try to extract from existing files or use current)
-                    existing_files = list(job_dir_path.glob('*.yaml'))
-                    if existing_files:
+                    with os.scandir(job_dir_path) as it:
+                        existing_yaml = next((entry.name for entry in it
+                                              if entry.name.endswith('.yaml') and not entry.name.startswith('.')), None)
+                    if existing_yaml:
                         # Extract timestamp from existing file
-                        filename_parts = existing_files[0].stem.split('.')
-                        timestamp = filename_parts[0] if filename_parts else datetime.now().strftime('%Y%m%d%H%M%S')
+                        timestamp = existing_yaml.split('.', 1)[0]
                     else:
                         timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
                     
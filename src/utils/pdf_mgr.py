@@ -123,7 +123,8 @@ class PDFManager:
         html_file: Union[str, Path], 
         output_path: Optional[Union[str, Path]] = None,
         engine: Optional[str] = None,
-        options: Optional[Dict] = None
+        options: Optional[Dict] = None,
+        html_content: Optional[str] = None
     ) -> Dict:
         """
         Convert a single HTML file to PDF.
@@ -133,13 +134,14 @@ class PDFManager:
             output_path: Output PDF path (defaults to same location as HTML with .pdf extension)
             engine: Specific engine to use (defaults to preferred engine)
             options: Engine-specific options
+            html_content: The file's HTML, when the caller already has it in memory (skips re-reading it)
         
         Returns:
             Dict with conversion results
         """
         html_file = Path(html_file)
         
-        if not html_file.exists():
+        if html_content is None and not html_file.exists():
             return {
                 'success': False,
                 'error': f'HTML file not found: {html_file}',
@@ -178,7 +180,7 @@ class PDFManager:
         
         try:
             if engine == 'weasyprint':
-                return self._convert_with_weasyprint(html_file, output_path, options)
+                return self._convert_with_weasyprint(html_file, output_path, options, html_content)
             else:
                 return {
                     'success': False,
@@ -194,7 +196,7 @@ class PDFManager:
                 'file': str(html_file)
             }
     
-    def _convert_with_weasyprint(self, html_file: Path, output_path: Path, options: Dict) -> Dict:
+    def _convert_with_weasyprint(self, html_file: Path, output_path: Path, options: Dict, html_content: Optional[str] = None) -> Dict:
         """Convert HTML to PDF using WeasyPrint."""
         try:
             from weasyprint import HTML, CSS
@@ -220,9 +222,10 @@ class PDFManager:
                 }
         
         try:
-            # Read HTML content
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = f.read()
+            # Read HTML content, unless the caller passed it in
+            if html_content is None:
+                with open(html_file, 'r', encoding='utf-8') as f:
+                    html_content = f.read()
             
             # Remove CSS link from HTML completely to avoid external dependency issues
             import re
@@ -599,7 +602,8 @@ class PDFManager:
         html_files: List[Union[str, Path]],
         output_dir: Optional[Union[str, Path]] = None,
         engine: Optional[str] = None,
-        options: Optional[Dict] = None
+        options: Optional[Dict] = None,
+        html_contents: Optional[Dict[str, str]] = None
     ) -> Dict:
         """
         Convert multiple HTML files to PDF.
@@ -609,6 +613,7 @@ class PDFManager:
             output_dir: Output directory for PDFs (defaults to same location as each HTML file)
             engine: Specific engine to use (defaults to preferred engine)
             options: Engine-specific options
+            html_contents: HTML already in memory, keyed by file name; those files aren't re-read
         
         Returns:
             Dict with batch conversion results
@@ -638,7 +643,8 @@ class PDFManager:
                 output_path = None  # Will default to same location as HTML file
             
             # Convert file
-            result = self.convert_html_to_pdf(html_file, output_path, engine, options)
+            html_content = html_contents.get(html_file.name) if html_contents else None
+            result = self.convert_html_to_pdf(html_file, output_path, engine, options, html_content)
             results.append(result)
             
             if result['success']:
@@ -710,13 +716,16 @@ class PDFManager:
 
 
 # Convenience functions for backward compatibility
-def print_pdf(job_id: str = None, output_dir: str = None) -> Dict:
+def print_pdf(job_id: str = None, output_dir: str = None, html_contents: Optional[Dict[str, str]] = None,
+              jobs_dir: Optional[Path] = None) -> Dict:
     """
     Legacy function for backward compatibility with step2_generate.py
     
     Args:
         job_id: Specific job ID to convert
         output_dir: Output directory for PDFs
+        html_contents: HTML already in memory, keyed by file name; those files aren't re-read
+        jobs_dir: Directory holding the generated job folders (defaults to src/jobs/2_generated)
     
     Returns:
         Dict with conversion results
@@ -724,7 +733,8 @@ def print_pdf(job_id: str = None, output_dir: str = None) -> Dict:
     pdf_manager = PDFManager()
     
     # Get jobs directory
-    jobs_dir = Path(__file__).parent / 'jobs' / '2_generated'
+    if jobs_dir is None:
+        jobs_dir = Path(__file__).parent.parent / 'jobs' / '2_generated'
     
     if not jobs_dir.exists():
         return {
@@ -746,7 +756,7 @@ def print_pdf(job_id: str = None, output_dir: str = None) -> Dict:
         }
     
     # Convert files
-    result = pdf_manager.convert_multiple_files(html_files, output_dir)
+    result = pdf_manager.convert_multiple_files(html_files, output_dir, html_contents=html_contents)
     
     # Format result for backward compatibility
     return {
@@ -17,6 +17,11 @@ from .ai_content_cache import AIContentCache
 
 logger = logging.getLogger(__name__)
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 class SectionType(Enum):
     """Enumeration of supported resume sections."""
     SUMMARY = "summary"
@@ -241,7 +246,7 @@ class SectionGenerator(ABC):
                 cleaned_response = '\n'.join(cleaned_lines)
             
             # Parse YAML
-            content = yaml.safe_load(cleaned_response.strip())
+            content = yaml.load(cleaned_response.strip(), Loader=_Loader)
             
             if not isinstance(content, dict):
                 raise ValueError(f"Parsed content is not a dictionary: {type(content)}")
@@ -534,7 +539,7 @@ class ExperienceGenerator(SectionGenerator):
                     if not (valid_short or valid_long):
                         self.logger.warning(f"Bullet character count {char_count} outside allowed ranges: {self.bullet_limits}")
                     else:
-                        self.logger.debug(f"Bullet character count {char_count} within acceptable range")
+                        self.logger.debug("Bullet character count %d within acceptable range", char_count)
     
     def get_prompt_template(self) -> str:
         return """
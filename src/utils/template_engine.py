@@ -7,6 +7,7 @@ content from the modular generation system.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
@@ -14,6 +15,23 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=None)
+def _environment(template_dir: str) -> Environment:
+    """
+    Returns the Jinja2 environment for template_dir, shared by every TemplateEngine using that directory
+    so compiled templates survive across jobs. auto_reload re-checks each template's modification time
+    on lookup, so edited templates are still picked up without a restart.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=True,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=True
+    )
+
+
 class TemplateEngine:
     """
     Merges structured content into HTML templates from src/resources/templates/.
@@ -39,13 +57,7 @@ class TemplateEngine:
         
         # Initialize Jinja2 environment
         if self.template_dir.exists():
-            self.env = Environment(
-                loader=FileSystemLoader(str(self.template_dir)),
-                autoescape=True,
-                trim_blocks=True,
-                lstrip_blocks=True,
-                cache_size=0  # Disable template caching
-            )
+            self.env = _environment(str(self.template_dir))
             self.logger.info(f"Template engine initialized with directory: {self.template_dir}")
         else:
             self.logger.warning(f"Template directory does not exist: {self.template_dir}")
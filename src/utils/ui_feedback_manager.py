@@ -269,7 +269,7 @@ class UIFeedbackManager:
             if job.batch_id and job.batch_id in self.batch_progress:
                 self.batch_progress[job.batch_id]['jobs'][job_id]['progress'] = job.overall_progress
         
-        self.logger.debug(f"Job {job_id} section '{section}' updated: {status} ({progress:.1%})")
+        self.logger.debug("Job %s section '%s' updated: %s (%.1f%%)", job_id, section, status, progress * 100)
         
         # Immediate update for section completions and failures
         if status in ["completed", "failed", "timeout"]:
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Tests for logging_setup: records queued for the listener thread are written out on flush.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+
+def test_flushed_records_survive_a_killed_process():
+    script = (
+        "import os, signal\n"
+        "from utils import logging_setup\n"
+        "logger = logging_setup.get_logger('flush_test')\n"
+        "for i in range(200):\n"
+        "    logger.info('record %d', i)\n"
+        "logging_setup.force_flush_logs()\n"
+        "os.kill(os.getpid(), signal.SIGKILL)\n"
+    )
+    result = subprocess.run([sys.executable, '-c', script], cwd=SRC_DIR, capture_output=True, text=True, timeout=60)
+
+    assert result.returncode != 0
+    assert 'flush_test - INFO - record 199' in result.stdout
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for step1_queue helpers: job ID discovery and text sanitization.
+"""
+
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from step1_queue import get_all_ids, load_id_index, write_id_index, append_id_index, sanitize_text_for_yaml, LiteralStr
+
+
+def _touch(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text('x', encoding='utf-8')
+
+
+class TestGetAllIds:
+    """Tests for get_all_ids directory scanning."""
+
+    def test_collects_ids_from_flat_files_and_subfolders(self, tmp_path):
+        _touch(tmp_path / '1_queued' / '20250101120000.111.Acme.Engineer.yaml')
+        _touch(tmp_path / '1_queued' / 'Beta.Manager.222.20250101120000' / '20250101120000.222.Beta.Manager.html')
+        _touch(tmp_path / '2_generated' / 'Gamma.Lead.333.20250101120000' / '20250101120000.333.Gamma.Lead.YAML')
+
+        assert get_all_ids(tmp_path) == ['111', '222', '333']
+
+    def test_skips_unexpected_names_and_extensions(self, tmp_path):
+        _touch(tmp_path / '20250101120000.444.Acme.Engineer.pdf')
+        _touch(tmp_path / '20250101120000.555.Acme.yaml')
+        _touch(tmp_path / '20250101120000.666.Acme.Engineer.Extra.html')
+        _touch(tmp_path / '.yaml')
+
+        assert get_all_ids(tmp_path) == []
+
+    def test_missing_path_returns_empty_list(self, tmp_path):
+        assert get_all_ids(tmp_path / 'does_not_exist') == []
+
+
+class TestIdIndex:
+    """Tests for the sidecar job ID index."""
+
+    def test_missing_index_returns_none(self, tmp_path):
+        assert load_id_index(tmp_path) is None
+
+    def test_write_then_append_round_trips(self, tmp_path):
+        write_id_index(tmp_path, {'222', '111'})
+        append_id_index(tmp_path, '333')
+
+        assert load_id_index(tmp_path) == {'111', '222', '333'}
+
+    def test_empty_index_is_written(self, tmp_path):
+        write_id_index(tmp_path, set())
+
+        assert load_id_index(tmp_path) == set()
+
+    def test_append_does_not_create_missing_index(self, tmp_path):
+        append_id_index(tmp_path, '111')
+
+        assert load_id_index(tmp_path) is None
+
+
+class TestSanitizeTextForYaml:
+    """Tests for sanitize_text_for_yaml."""
+
+    def test_replaces_smart_punctuation(self):
+        assert sanitize_text_for_yaml('\u2018a\u2019 \u201cb\u201d c\u2013d\u2014e') == '\'a\' "b" c-d-e'
+
+    def test_removes_control_and_non_printable_characters(self):
+        text = 'a\x00b\x07c\u200bd\ufeffe\u00adf\ue000g\u2028h'
+        assert sanitize_text_for_yaml(text) == 'abcdefgh'
+
+    def test_keeps_common_whitespace_and_collapses_runs(self):
+        text = '  line1\tx   y\r\n\n\n\nline2  '
+        assert sanitize_text_for_yaml(text) == 'line1\tx y\r\n\nline2'
+
+    def test_non_strings_pass_through(self):
+        assert sanitize_text_for_yaml(None) is None
+        assert sanitize_text_for_yaml(42) == 42
+
+    def test_literal_str_is_not_sanitized_again(self):
+        text = LiteralStr(sanitize_text_for_yaml('line1\n\nline2'))
+        assert sanitize_text_for_yaml(text) is text
+
+
+class TestFetchJobPages:
+    """Tests for the bounded job page fetch pipeline."""
+
+    def test_yields_in_order_with_bounded_lookahead(self, monkeypatch):
+        import step1_queue
+
+        started = []
+
+        def fake_fetch(link):
+            started.append(link)
+            return 200, link.encode(), 'utf-8'
+
+        monkeypatch.setattr(step1_queue, '_fetch_job_page', fake_fetch)
+
+        jobs = [{'id': str(i), 'link': f'https://example.com/{i}'} for i in range(40)]
+        for consumed, (job, page) in enumerate(step1_queue._fetch_job_pages(jobs)):
+            assert job is jobs[consumed]
+            assert page.result() == (200, job['link'].encode(), 'utf-8')
+            assert len(started) <= consumed + step1_queue.FETCH_WINDOW
+        assert len(started) == len(jobs)
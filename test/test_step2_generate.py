@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Tests for step2_generate helpers: resume loading, LLM generation and job file handling.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from step2_generate import load_resume_file
+
+
+class TestLoadResumeFile:
+    """Tests for load_resume_file and its parsed-resume cache."""
+
+    def test_unchanged_file_returns_cached_resume(self, tmp_path):
+        resume_path = tmp_path / 'resume.yaml'
+        resume_path.write_text('name: Test Person\nskills:\n\t- Python\n', encoding='utf-8')
+
+        first = load_resume_file(resume_path)
+        assert first == {'name': 'Test Person', 'skills': ['Python']}
+        assert load_resume_file(resume_path) is first
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        resume_path = tmp_path / 'resume.yaml'
+        resume_path.write_text('name: Before\n', encoding='utf-8')
+        assert load_resume_file(resume_path)['name'] == 'Before'
+
+        resume_path.write_text('name: After\n', encoding='utf-8')
+        stat = resume_path.stat()
+        os.utime(resume_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_resume_file(resume_path)['name'] == 'After'
+
+
+class TestReadYamlHeader:
+    """Tests for the header-only job YAML read used by bundle_to_directory."""
+
+    def test_reads_wrapped_values_without_the_description(self, tmp_path):
+        from step2_generate import _read_yaml_header
+
+        title = 'Senior Engineer: Platform ' * 6
+        job_path = tmp_path / 'job.yaml'
+        job_path.write_text(f'id: \'1\'\ntitle: "{title}"\ncompany: Acme\ndescription: |-\n  company: not this\n',
+                            encoding='utf-8')
+
+        assert _read_yaml_header(job_path) == {'title': title, 'company': 'Acme'}
+
+    def test_missing_key_falls_back_to_full_parse(self, tmp_path):
+        from step2_generate import _read_yaml_header
+
+        job_path = tmp_path / 'job.yaml'
+        job_path.write_text('id: \'1\'\ncompany: Acme\n', encoding='utf-8')
+
+        assert _read_yaml_header(job_path) == {'id': '1', 'company': 'Acme'}
+
+
+class TestQueuedYamlById:
+    """Tests for the queued job file lookup used by generate()."""
+
+    def test_maps_flat_and_subfolder_files_preferring_flat(self, tmp_path):
+        from step2_generate import _queued_yaml_by_id
+
+        for name in ('20250101000000.1.Acme.Eng.yaml', '20250101000000.1.Acme.Eng.html',
+                     'Beta.Mgr.2.20250102000000/20250102000000.2.Beta.Mgr.yaml',
+                     'Acme.Eng.1.20250103000000/20250103000000.1.Acme.Eng.yaml'):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text('x', encoding='utf-8')
+
+        assert _queued_yaml_by_id(tmp_path) == {
+            '1': tmp_path / '20250101000000.1.Acme.Eng.yaml',
+            '2': tmp_path / 'Beta.Mgr.2.20250102000000' / '20250102000000.2.Beta.Mgr.yaml',
+        }
+
+    def test_specific_id_maps_only_that_job(self, tmp_path):
+        from step2_generate import _queued_yaml_by_id
+
+        for name in ('20250101000000.1.Acme.Eng.yaml',
+                     'Beta.Mgr.2.20250102000000/20250102000000.2.Beta.Mgr.yaml'):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text('x', encoding='utf-8')
+
+        assert _queued_yaml_by_id(tmp_path, '2') == {
+            '2': tmp_path / 'Beta.Mgr.2.20250102000000' / '20250102000000.2.Beta.Mgr.yaml',
+        }
+        assert _queued_yaml_by_id(tmp_path, '1') == {'1': tmp_path / '20250101000000.1.Acme.Eng.yaml'}
+
+
+class TestFindJobDirectory:
+    """Tests for the job folder lookup used for modular content caching."""
+
+    def test_prefers_exact_prefix_then_falls_back_to_substring_match(self, tmp_path):
+        from step2_generate import _find_job_directory
+
+        (tmp_path / 'Old Acme.Eng.1.20250101000000').mkdir()
+        (tmp_path / 'Acme.Eng.1.20250102000000').mkdir()
+
+        assert _find_job_directory(tmp_path, '1', 'Acme', 'Eng') == str(tmp_path / 'Acme.Eng.1.20250102000000')
+        assert _find_job_directory(tmp_path, '1', 'Old', 'Eng') == str(tmp_path / 'Old Acme.Eng.1.20250101000000')
+        assert _find_job_directory(tmp_path, '7', 'Acme', 'Eng') is None
+        assert _find_job_directory(tmp_path / 'missing', '1', 'Acme', 'Eng') is None
+
+
+class TestSubdirsWithId:
+    """Tests for the job subfolder lookup used when moving jobs between stages."""
+
+    def test_matches_folder_name_and_contents(self, tmp_path):
+        from step2_generate import _subdirs_with_id
+
+        for name in ('Acme.Eng.1.20250101000000/20250101000000.1.Acme.Eng.yaml',
+                     'Beta.Mgr.2.20250101000000/20250101000000.2.Beta.Mgr.yaml',
+                     'Gamma.Team 1.3.20250101000000/20250101000000.3.Gamma.Team 1.yaml'):
+            (tmp_path / name).parent.mkdir(parents=True)
+            (tmp_path / name).write_text('x', encoding='utf-8')
+        (tmp_path / '20250101000000.1.Acme.Eng.yaml').write_text('x', encoding='utf-8')
+
+        assert _subdirs_with_id(tmp_path, '1') == [tmp_path / 'Acme.Eng.1.20250101000000']
+        assert _subdirs_with_id(tmp_path, '7') == []
+
+
+class TestReplaceDir:
+    """Tests for moving a job folder over an existing one."""
+
+    def test_replaces_missing_empty_and_non_empty_destinations(self, tmp_path):
+        from step2_generate import _replace_dir
+
+        for case, existing in enumerate((None, [], ['old.yaml'])):
+            source = tmp_path / f'src{case}'
+            source.mkdir()
+            (source / 'new.yaml').write_text('x', encoding='utf-8')
+            destination = tmp_path / f'dest{case}'
+            if existing is not None:
+                destination.mkdir()
+                for name in existing:
+                    (destination / name).write_text('x', encoding='utf-8')
+
+            _replace_dir(source, destination)
+
+            assert not source.exists()
+            assert os.listdir(destination) == ['new.yaml']
+
+
+class TestWriteText:
+    """Tests for the unbuffered output file writer."""
+
+    def test_writes_utf8_and_truncates_existing_file(self, tmp_path):
+        from step2_generate import _write_text
+
+        out_path = tmp_path / 'out.html'
+        out_path.write_text('x' * 100, encoding='utf-8')
+        _write_text(str(out_path), '<p>café – résumé</p>\n')
+
+        assert out_path.read_bytes() == '<p>café – résumé</p>\n'.encode('utf-8')
+
+
+class TestLoadQueuedJobs:
+    """Tests for load_queued_jobs when a specific job ID is requested."""
+
+    def test_specific_id_skips_only_when_already_processed(self, tmp_path, monkeypatch):
+        import step2_generate
+
+        for name in ('1_queued/Acme.Eng.1.20250101000000/20250101000000.1.Acme.Eng.yaml',
+                     '1_queued/Beta.Mgr.2.20250101000000/20250101000000.2.Beta.Mgr.yaml',
+                     '2_generated/Acme.Eng.1.20250101000000/20250101000000.1.Acme.Eng.yaml'):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_text(f"id: '{name.split('.')[-4]}'\n", encoding='utf-8')
+        monkeypatch.setattr(step2_generate, 'JOBS_DIR', tmp_path)
+        monkeypatch.setattr(step2_generate, 'QUEUED_DIR', tmp_path / '1_queued')
+
+        assert step2_generate.load_queued_jobs(specific_job_id='1') == []
+        assert step2_generate.load_queued_jobs(specific_job_id='2') == [{'id': '2'}]
+        assert step2_generate.load_queued_jobs(force=True, specific_job_id='1') == [{'id': '1'}]
+
+    def test_specific_id_ignores_files_without_an_id(self, tmp_path, monkeypatch):
+        import step2_generate
+
+        queued = tmp_path / '1_queued'
+        queued.mkdir()
+        (queued / 'notes.yaml').write_text("id: 'none'\n", encoding='utf-8')
+        (queued / '20250101000000.3.Gamma.Lead.yaml').write_text("id: '3'\n", encoding='utf-8')
+        monkeypatch.setattr(step2_generate, 'JOBS_DIR', tmp_path)
+        monkeypatch.setattr(step2_generate, 'QUEUED_DIR', queued)
+
+        assert step2_generate.load_queued_jobs(specific_job_id='3') == [{'id': '3'}]
+
+    def test_unparseable_file_is_skipped(self, tmp_path, monkeypatch):
+        import step2_generate
+
+        queued = tmp_path / '1_queued'
+        for i, body in enumerate(("id: '1'\n", "id: [unclosed\n", "id: '3'\n"), start=1):
+            name = f'Co.T.{i}.20250101000000/20250101000000.{i}.Co.T.yaml'
+            (queued / name).parent.mkdir(parents=True)
+            (queued / name).write_text(body, encoding='utf-8')
+        monkeypatch.setattr(step2_generate, 'JOBS_DIR', tmp_path)
+        monkeypatch.setattr(step2_generate, 'QUEUED_DIR', queued)
+
+        jobs = step2_generate.load_queued_jobs(force=True)
+        assert sorted(job['id'] for job in jobs) == ['1', '3']
+
+
+class TestModularCoverLetterReuse:
+    """Tests that the modular cover letter comes from the resume's generation run."""
+
+    def test_resume_run_returns_its_cover_letter(self, tmp_path, monkeypatch):
+        import step2_generate
+
+        runs = []
+
+        class FakeGenerator:
+            def __init__(self, config):
+                pass
+
+            def generate_resume(self, resume, job, job_id, job_directory=None, use_cache=True):
+                runs.append(job_id)
+                return {'success': True, 'html_resume': 'R', 'html_cover_letter': f'C{len(runs)}'}
+
+        class FakeConfig:
+            modular = True
+
+            def is_modular_enabled(self):
+                return self.modular
+
+            def to_dict(self):
+                return {}
+
+        config = FakeConfig()
+        monkeypatch.setattr(step2_generate, 'MODULAR_AVAILABLE', True)
+        monkeypatch.setattr(step2_generate, 'ModularResumeGenerator', FakeGenerator, raising=False)
+        monkeypatch.setattr(step2_generate, 'get_config', lambda: config, raising=False)
+        monkeypatch.setattr(step2_generate, 'QUEUED_DIR', tmp_path)
+        monkeypatch.setattr(step2_generate, 'GENERATED_DIR', tmp_path)
+        monkeypatch.setattr(step2_generate, 'llm_generate_custom_resume_legacy', lambda *args: 'legacy')
+        resume, job = {'name': 'A'}, {'id': '1', 'company': 'Acme', 'title': 'Eng'}
+
+        assert step2_generate.llm_generate_custom_resume_with_coverletter(resume, job) == ('R', 'C1')
+        assert len(runs) == 1
+
+        # The standalone cover letter step runs its own generation
+        assert step2_generate.llm_generate_custom_coverletter_modular(resume, job, 'R') == 'C2'
+
+        # The legacy generator leaves the cover letter to its own LLM call
+        config.modular = False
+        assert step2_generate.llm_generate_custom_resume_with_coverletter(resume, job) == ('legacy', None)
+
+
+class TestMoveQueuedToGeneratedWithValidation:
+    """Tests for moving a finished job and returning incomplete generated jobs to the queue."""
+
+    def test_incomplete_jobs_return_to_queued(self, tmp_path, monkeypatch):
+        import step2_generate
+
+        queued, generated = tmp_path / '1_queued', tmp_path / '2_generated'
+        for folder, sections in ((queued / 'Acme.Eng.1.20250101000000', 7),
+                                 (generated / 'Beta.Mgr.2.20250101000000', 3),
+                                 (generated / 'Gamma.Lead.3.20250101000000', 7)):
+            (folder / 'ai_content').mkdir(parents=True)
+            job_id = folder.name.split('.')[2]
+            (folder / f'20250101000000.{job_id}.Co.T.yaml').write_text('x', encoding='utf-8')
+            for i in range(sections):
+                (folder / 'ai_content' / f'section{i}.yaml').write_text('x', encoding='utf-8')
+        (generated / 'notes.txt').write_text('x', encoding='utf-8')
+        monkeypatch.setattr(step2_generate, 'QUEUED_DIR', queued)
+        monkeypatch.setattr(step2_generate, 'GENERATED_DIR', generated)
+
+        assert step2_generate.move_queued_to_generated_with_validation('1')
+        assert sorted(os.listdir(generated)) == ['Acme.Eng.1.20250101000000', 'Gamma.Lead.3.20250101000000', 'notes.txt']
+        assert os.listdir(queued) == ['Beta.Mgr.2.20250101000000']
+
+
+class TestPrintPdf:
+    """Tests that print_pdf converts the job's files from the generated directory."""
+
+    def test_finds_job_files_and_passes_html_contents(self, tmp_path, monkeypatch):
+        import step2_generate
+        from src.utils import pdf_mgr
+
+        job_dir = tmp_path / 'Acme.Eng.5.20250101000000'
+        job_dir.mkdir()
+        for name in ('20250101000000.5.Acme.resume.html', '20250101000000.5.Acme.coverletter.html'):
+            (job_dir / name).write_text('<html></html>', encoding='utf-8')
+        calls = []
+
+        def fake_convert(self, html_files, output_dir=None, engine=None, options=None, html_contents=None):
+            calls.append((sorted(f.name for f in html_files), html_contents))
+            return {'success': True, 'message': '', 'converted': len(html_files), 'failed': 0,
+                    'results': [], 'engine_used': 'fake'}
+
+        monkeypatch.setattr(step2_generate, 'GENERATED_DIR', tmp_path)
+        monkeypatch.setattr(pdf_mgr.PDFManager, 'convert_multiple_files', fake_convert)
+        contents = {'20250101000000.5.Acme.resume.html': '<html>resume</html>'}
+
+        assert step2_generate.print_pdf('5', html_contents=contents)['converted'] == 2
+        assert calls == [(['20250101000000.5.Acme.coverletter.html', '20250101000000.5.Acme.resume.html'], contents)]